@@ -6,8 +6,11 @@ from paystackease.core import (
     PayStackServerError as PayStackServerError,
     PayStackSignatureVerifyError as PayStackSignatureVerifyError,
     PayStackWebhook as PayStackWebhook,
+    RawJSON as RawJSON,
     SecretKeyError as SecretKeyError,
     TypeValueError as TypeValueError,
+    configure as configure,
+    close_shared_connector as close_shared_connector,
 )
 from paystackease.apaystack import AsyncPayStackBase as AsyncPayStackBase
 from paystackease.paystack import PayStackBase as PayStackBase
@@ -51,6 +54,9 @@ __all__ = [
     'SecretKeyError',
     'TypeValueError',
     'InvalidRequestMethodError',
+    'configure',
+    'close_shared_connector',
+    'RawJSON',
     'convert_to_subunit',
     'AccountType',
     'Bearer',
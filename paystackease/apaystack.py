@@ -2,6 +2,10 @@
 providing simplified access to functionality in Paystack
 """
 
+from typing import Optional, Tuple
+
+from aiohttp import ClientSession
+
 from paystackease.apis.async_apis import (
     aapple_pay,
     abulk_charges,
@@ -27,91 +31,99 @@ from paystackease.apis.async_apis import (
     atransfers_control,
     averification,
 )
+from paystackease.core import AsyncBaseClientAPI
 from paystackease.metadata.__version__ import __version__
 
 
 class AsyncPayStackBase:
     """AsyncPayStackBase acts as a wrapper around various client APIs to
     interact with the PayStack API
+
+    :param: session: A client session shared by every client API.
+        If not given, one is created when entering the context and closed on exit.
     """
 
     VERSION = __version__
 
     # pylint: disable=too-many-instance-attributes
-    def __init__(self):
-        self.apple_pay = aapple_pay.AsyncApplePayClientAPI()
-        self.bulk_charges = abulk_charges.AsyncBulkChargesClientAPI()
-        self.charges = acharges.AsyncChargesClientAPI()
-        self.customers = acustomers.AsyncCustomerClientAPI()
-        self.dedicated_virtual_accounts = adedicated_virtual_accounts.AsyncDedicatedVirtualAccountClientAPI()
-        self.disputes = adisputes.AsyncDisputesClientAPI()
-        self.integration = aintegration.AsyncIntegrationClientAPI()
-        self.miscellaneous = amiscellaneous.AsyncMiscellaneousClientAPI()
-        self.payment_pages = apayment_pages.AsyncPaymentPagesClientAPI()
-        self.payment_requests = apayment_requests.AsyncPaymentRequestClientAPI()
-        self.plans = aplans.AsyncPlanClientAPI()
-        self.products = aproducts.AsyncProductClientAPI()
-        self.refund = arefund.AsyncRefundClientAPI()
-        self.settlements = asettlements.AsyncSettlementClientAPI()
-        self.subaccounts = asubaccounts.AsyncSubAccountClientAPI()
-        self.subscriptions = asubscriptions.AsyncSubscriptionClientAPI()
-        self.terminal = aterminal.AsyncTerminalClientAPI()
-        self.transaction_splits = atransaction_splits.AsyncTransactionSplitClientAPI()
-        self.transactions = atransactions.AsyncTransactionClientAPI()
-        self.transfer_recipients = atransfer_recipients.AsyncTransferRecipientsClientAPI()
-        self.transfers = atransfers.AsyncTransfersClientAPI()
-        self.transfer_control = atransfers_control.AsyncTransferControlClientAPI()
-        self.verification = averification.AsyncVerificationClientAPI()
+    def __init__(self, session: Optional[ClientSession] = None):
+        self._session = session
+        self._owns_session = session is None
+        self.apple_pay = aapple_pay.AsyncApplePayClientAPI(session=session)
+        self.bulk_charges = abulk_charges.AsyncBulkChargesClientAPI(session=session)
+        self.charges = acharges.AsyncChargesClientAPI(session=session)
+        self.customers = acustomers.AsyncCustomerClientAPI(session=session)
+        self.dedicated_virtual_accounts = adedicated_virtual_accounts.AsyncDedicatedVirtualAccountClientAPI(session=session)
+        self.disputes = adisputes.AsyncDisputesClientAPI(session=session)
+        self.integration = aintegration.AsyncIntegrationClientAPI(session=session)
+        self.miscellaneous = amiscellaneous.AsyncMiscellaneousClientAPI(session=session)
+        self.payment_pages = apayment_pages.AsyncPaymentPagesClientAPI(session=session)
+        self.payment_requests = apayment_requests.AsyncPaymentRequestClientAPI(session=session)
+        self.plans = aplans.AsyncPlanClientAPI(session=session)
+        self.products = aproducts.AsyncProductClientAPI(session=session)
+        self.refund = arefund.AsyncRefundClientAPI(session=session)
+        self.settlements = asettlements.AsyncSettlementClientAPI(session=session)
+        self.subaccounts = asubaccounts.AsyncSubAccountClientAPI(session=session)
+        self.subscriptions = asubscriptions.AsyncSubscriptionClientAPI(session=session)
+        self.terminal = aterminal.AsyncTerminalClientAPI(session=session)
+        self.transaction_splits = atransaction_splits.AsyncTransactionSplitClientAPI(session=session)
+        self.transactions = atransactions.AsyncTransactionClientAPI(session=session)
+        self.transfer_recipients = atransfer_recipients.AsyncTransferRecipientsClientAPI(session=session)
+        self.transfers = atransfers.AsyncTransfersClientAPI(session=session)
+        self.transfer_control = atransfers_control.AsyncTransferControlClientAPI(session=session)
+        self.verification = averification.AsyncVerificationClientAPI(session=session)
+
+    @property
+    def _clients(self) -> Tuple[AsyncBaseClientAPI, ...]:
+        return (
+            self.apple_pay,
+            self.bulk_charges,
+            self.charges,
+            self.customers,
+            self.dedicated_virtual_accounts,
+            self.disputes,
+            self.integration,
+            self.miscellaneous,
+            self.payment_pages,
+            self.payment_requests,
+            self.plans,
+            self.products,
+            self.refund,
+            self.settlements,
+            self.subaccounts,
+            self.subscriptions,
+            self.terminal,
+            self.transaction_splits,
+            self.transactions,
+            self.transfer_recipients,
+            self.transfers,
+            self.transfer_control,
+            self.verification,
+        )
 
     async def __aenter__(self):
-        # await super().__aenter__()
-        await self.apple_pay.__aenter__()
-        await self.bulk_charges.__aenter__()
-        await self.charges.__aenter__()
-        await self.customers.__aenter__()
-        await self.dedicated_virtual_accounts.__aenter__()
-        await self.disputes.__aenter__()
-        await self.integration.__aenter__()
-        await self.miscellaneous.__aenter__()
-        await self.payment_pages.__aenter__()
-        await self.payment_requests.__aenter__()
-        await self.plans.__aenter__()
-        await self.products.__aenter__()
-        await self.refund.__aenter__()
-        await self.settlements.__aenter__()
-        await self.subaccounts.__aenter__()
-        await self.subscriptions.__aenter__()
-        await self.terminal.__aenter__()
-        await self.transaction_splits.__aenter__()
-        await self.transactions.__aenter__()
-        await self.transfer_recipients.__aenter__()
-        await self.transfers.__aenter__()
-        await self.transfer_control.__aenter__()
-        await self.verification.__aenter__()
+        # pylint: disable=protected-access
+        if self._session is None or (self._owns_session and self._session.closed):
+            # One session for every client, drawing from the shared connection pool
+            self._session = self.charges._make_session()
+            self._owns_session = True
+        for client in self._clients:
+            await client._use_session(self._session)
         return self
 
     async def __aexit__(self, *args):
-        await self.apple_pay.__aexit__(*args)
-        await self.bulk_charges.__aexit__(*args)
-        await self.charges.__aexit__(*args)
-        await self.customers.__aexit__(*args)
-        await self.dedicated_virtual_accounts.__aexit__(*args)
-        await self.disputes.__aexit__(*args)
-        await self.integration.__aexit__(*args)
-        await self.miscellaneous.__aexit__(*args)
-        await self.payment_pages.__aexit__(*args)
-        await self.payment_requests.__aexit__(*args)
-        await self.plans.__aexit__(*args)
-        await self.products.__aexit__(*args)
-        await self.refund.__aexit__(*args)
-        await self.settlements.__aexit__(*args)
-        await self.subaccounts.__aexit__(*args)
-        await self.subscriptions.__aexit__(*args)
-        await self.terminal.__aexit__(*args)
-        await self.transaction_splits.__aexit__(*args)
-        await self.transactions.__aexit__(*args)
-        await self.transfer_recipients.__aexit__(*args)
-        await self.transfers.__aexit__(*args)
-        await self.transfer_control.__aexit__(*args)
-        await self.verification.__aexit__(*args)
-        # await super().__aexit__(*args)
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the client sessions, leaving a session passed in by the caller open
+        :return:
+        """
+        # pylint: disable=protected-access
+        for client in self._clients:
+            await client.aclose()
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            for client in self._clients:
+                client._release_session(self._session)
+            self._session = None
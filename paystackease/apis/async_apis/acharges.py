@@ -5,11 +5,21 @@ The Charge API allows you to configure payment channel of your choice when initi
 """
 
 from datetime import date
-from typing import Optional, Dict, Any, List, Union
+from functools import partial
+from typing import Optional, Dict, Any, Awaitable, List, Union
 
-from paystackease.core import AsyncRequestAPI, PayStackResponse
+from paystackease.core import cached_response, AsyncRequestAPI, PayStackResponse, RawJSON, TypeValueError
 from paystackease.helpers import PWT
 
+_CHARGE_ENDPOINT = "/charge"
+_CHARGE_SUBMIT_PIN = _CHARGE_ENDPOINT + "/submit_pin"
+_CHARGE_SUBMIT_OTP = _CHARGE_ENDPOINT + "/submit_otp"
+_CHARGE_SUBMIT_PHONE = _CHARGE_ENDPOINT + "/submit_phone"
+_CHARGE_SUBMIT_BIRTHDAY = _CHARGE_ENDPOINT + "/submit_birthday"
+_CHARGE_SUBMIT_ADDRESS = _CHARGE_ENDPOINT + "/submit_address"
+
+_SUBMIT_STEPS = ("pin", "otp", "phone", "birthday", "address")
+
 
 class AsyncChargesClientAPI(AsyncRequestAPI):
     """
@@ -21,7 +31,7 @@ class AsyncChargesClientAPI(AsyncRequestAPI):
         self,
             email: str,
             amount: int,
-            metadata: Dict[str, List[Dict[str, Any]]],
+            metadata: Union[Dict[str, List[Dict[str, Any]]], RawJSON],
             authorization_code: Optional[Union[str, None]] = None,
             pin: Optional[Union[int, None]] = None,
             reference: Optional[Union[str, None]] = None,
@@ -47,6 +57,7 @@ class AsyncChargesClientAPI(AsyncRequestAPI):
         :param: mobile_money (Set Keys as: {phone, provider}, and value {phone_number, MobileMoney.value.value})
         :param: device_id
         :param: metadata A JSON object, which is passed as-is to your integration API
+            A RawJSON of the metadata already encoded is sent without being encoded again.
 
         note::
 
@@ -81,7 +92,19 @@ class AsyncChargesClientAPI(AsyncRequestAPI):
             "mobile_money": mobile_money,
             "device_id": device_id,
         }
-        return await self._post_request("/charge", data=data)
+        return await self._post_request(_CHARGE_ENDPOINT, data=data)
+
+    def _submit(self, path: str, field: str, value: Any, reference: str) -> Awaitable[PayStackResponse]:
+        """
+        Submit the single value a charge step asks for.
+        The request is returned to be awaited by the caller, so no extra coroutine is created.
+        :param path: The submit endpoint of the step
+        :param field: The name of the value in the request body
+        :param value:
+        :param reference:
+        :return:
+        """
+        return self._post_request(path, data={field: value, "reference": reference})
 
     async def submit_pin(self, pin: int, reference: str) -> PayStackResponse:
         """
@@ -93,11 +116,7 @@ class AsyncChargesClientAPI(AsyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        data = {
-            "pin": pin,
-            "reference": reference,
-        }
-        return await self._post_request("/charge/submit_pin", data=data)
+        return await self._submit(_CHARGE_SUBMIT_PIN, "pin", pin, reference)
 
     async def submit_otp(self, otp: int, reference: str) -> PayStackResponse:
         """
@@ -109,11 +128,7 @@ class AsyncChargesClientAPI(AsyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        data = {
-            "otp": otp,
-            "reference": reference,
-        }
-        return await self._post_request("/charge/submit_otp", data=data)
+        return await self._submit(_CHARGE_SUBMIT_OTP, "otp", otp, reference)
 
     async def submit_phone(self, phone: str, reference: str) -> PayStackResponse:
         """
@@ -125,11 +140,7 @@ class AsyncChargesClientAPI(AsyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        data = {
-            "phone": phone,
-            "reference": reference,
-        }
-        return await self._post_request("/charge/submit_phone", data=data)
+        return await self._submit(_CHARGE_SUBMIT_PHONE, "phone", phone, reference)
 
     async def submit_birthday(self, birthday: date, reference: str) -> PayStackResponse:
         """
@@ -145,13 +156,7 @@ class AsyncChargesClientAPI(AsyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        birthday = self._convert_to_string(birthday)
-
-        data = {
-            "birthday": birthday,
-            "reference": reference,
-        }
-        return await self._post_request("/charge/submit_birthday", data=data)
+        return await self._submit(_CHARGE_SUBMIT_BIRTHDAY, "birthday", self._convert_to_string(birthday), reference)
 
     async def submit_address(
         self, reference: str, address: str, city: str, state: str, zipcode: str
@@ -175,15 +180,76 @@ class AsyncChargesClientAPI(AsyncRequestAPI):
             "state": state,
             "zip_code": zipcode,
         }
-        return await self._post_request("/charge/submit_address", data=data)
+        return await self._post_request(_CHARGE_SUBMIT_ADDRESS, data=data)
 
+    @cached_response(ttl=0)
     async def check_pending_charge(self, reference: str) -> PayStackResponse:
         """
         Check pending charge
 
         :param: reference
 
+        note::
+
+            Concurrent checks of the same reference share one request,
+            every later check asks Paystack again.
+
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return await self._get_request(f"/charge/{reference}")
+        return await self._get_request(f"{_CHARGE_ENDPOINT}/{reference}")
+
+    async def check_pending_charges(
+            self,
+            references: List[str],
+            concurrency: int = 10,
+    ) -> List[Union[PayStackResponse, BaseException]]:
+        """
+        Check many pending charges concurrently
+
+        :param: references: The references of the pending charges
+        :param: concurrency: The maximum number of requests sent to Paystack at once, at least 1
+
+        note::
+
+            All the requests share the client session, so they reuse its pooled connections.
+
+        :raise TypeValueError: if concurrency is below 1
+
+        :return: The PayStackResponse, or the error raised, for each reference in order
+        :rtype: list
+        """
+        return await self._gather_requests(
+            (partial(self.check_pending_charge, reference) for reference in references),
+            concurrency=concurrency,
+        )
+
+    async def submit_batch(
+            self,
+            step: str,
+            payloads: List[Dict[str, Any]],
+            concurrency: int = 10,
+    ) -> List[Union[PayStackResponse, BaseException]]:
+        """
+        Submit the same charge step for many charges concurrently
+
+        :param: step: The step to submit: pin, otp, phone, birthday or address
+        :param: payloads: The keyword arguments of the submit method for each charge
+        :param: concurrency: The maximum number of requests sent to Paystack at once, at least 1
+
+        note::
+
+            A failed submission does not stop the others, the error raised is returned in its place.
+
+        :raise TypeValueError: if the step is not supported or concurrency is below 1
+
+        :return: The PayStackResponse, or the error raised, for each payload in order
+        :rtype: list
+        """
+        if step not in _SUBMIT_STEPS:
+            raise TypeValueError(f"Invalid step: {step}. Supported steps are {', '.join(_SUBMIT_STEPS)}")
+        submit = getattr(self, f"submit_{step}")
+        return await self._gather_requests(
+            (partial(submit, **payload) for payload in payloads),
+            concurrency=concurrency,
+        )
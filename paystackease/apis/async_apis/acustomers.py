@@ -7,9 +7,13 @@ The Customers API allows you to create and manage customers on your integration.
 from datetime import date
 from typing import Optional, Dict, Any, Union
 
-from paystackease.core import AsyncRequestAPI, PayStackResponse
+from paystackease.core import cached_response, invalidates_cached, AsyncRequestAPI, PayStackResponse, RawJSON
 from paystackease.helpers import RiskAction
 
+_CUSTOMER_ENDPOINT = "/customer"
+_CUSTOMER_SET_RISK_ACTION = _CUSTOMER_ENDPOINT + "/set_risk_action"
+_CUSTOMER_DEACTIVATE_AUTHORIZATION = _CUSTOMER_ENDPOINT + "/deactivate_authorization"
+
 
 class AsyncCustomerClientAPI(AsyncRequestAPI):
     """
@@ -23,7 +27,7 @@ class AsyncCustomerClientAPI(AsyncRequestAPI):
             first_name: str,
             last_name: str,
             phone: str,
-            metadata: Optional[Union[Dict[str, Any], None]] = None
+            metadata: Optional[Union[Dict[str, Any], RawJSON, None]] = None
     ) -> PayStackResponse:
         """
         Create a customer
@@ -32,7 +36,7 @@ class AsyncCustomerClientAPI(AsyncRequestAPI):
         :param: first_name: The first name of the customer.
         :param: last_name: The last name of the customer.
         :param: phone: The phone number of the customer.
-        :param: metadata: The metadata of the customer in JSON format.
+        :param: metadata: The metadata of the customer in JSON format, or a RawJSON of it already encoded.
 
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
@@ -44,8 +48,9 @@ class AsyncCustomerClientAPI(AsyncRequestAPI):
             "phone": phone,
             "metadata": metadata,
         }
-        return await self._post_request("/customer", data=data)
+        return await self._post_request(_CUSTOMER_ENDPOINT, data=data)
 
+    @invalidates_cached("fetch_customer")
     async def validate_customer(
             self,
             email_or_code: str,
@@ -87,8 +92,9 @@ class AsyncCustomerClientAPI(AsyncRequestAPI):
             "bank_code": bank_code,
             "account_number": account_number,
         }
-        return await self._post_request(f"customer/{email_or_code}/identification", data=data)
+        return await self._post_request(f"{_CUSTOMER_ENDPOINT}/{email_or_code}/identification", data=data)
 
+    @invalidates_cached("fetch_customer")
     async def whitelist_blacklist_customer(
             self, email_or_code: str, risk_action: Optional[Union[RiskAction, None]] = None
     ) -> PayStackResponse:
@@ -105,8 +111,9 @@ class AsyncCustomerClientAPI(AsyncRequestAPI):
             "customer": email_or_code,
             "risk_action": risk_action
         }
-        return await self._post_request("/customer/set_risk_action", data=data)
+        return await self._post_request(_CUSTOMER_SET_RISK_ACTION, data=data)
 
+    @invalidates_cached("fetch_customer")
     async def deactivate_authorization(self, authorization_code: str) -> PayStackResponse:
         """
         Deactivate an authorization when the card needs to be forgotten
@@ -117,15 +124,16 @@ class AsyncCustomerClientAPI(AsyncRequestAPI):
         :rtype: PayStackResponse object
         """
         data = {"authorization_code": authorization_code}
-        return await self._post_request("/customer/deactivate_authorization", data=data)
+        return await self._post_request(_CUSTOMER_DEACTIVATE_AUTHORIZATION, data=data)
 
+    @invalidates_cached("fetch_customer")
     async def update_customer(
             self,
             customer_code: str,
             first_name: Optional[Union[str, None]] = None,
             last_name: Optional[Union[str, None]] = None,
             phone: Optional[Union[str, None]] = None,
-            metadata: Optional[Union[Dict[str, Any], None]] = None
+            metadata: Optional[Union[Dict[str, Any], RawJSON, None]] = None
     ) -> PayStackResponse:
         """
         Update a customer
@@ -135,6 +143,7 @@ class AsyncCustomerClientAPI(AsyncRequestAPI):
         :param: last_name: The last name of the customer.
         :param: phone: The phone number of the customer.
         :param: metadata: The metadata of the customer in JSON format. {"key1": "value1", "key2": "value2"}
+            A RawJSON of the metadata already encoded is sent as-is.
 
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
@@ -145,18 +154,24 @@ class AsyncCustomerClientAPI(AsyncRequestAPI):
             "phone": phone,
             "metadata": metadata,
         }
-        return await self._put_request(f"/customer/{customer_code}", data=data)
+        return await self._put_request(f"{_CUSTOMER_ENDPOINT}/{customer_code}", data=data)
 
+    @cached_response(ttl=2)
     async def fetch_customer(self, email_or_code: str) -> PayStackResponse:
         """
         Fetch details of a specific customer
 
         :param: email_or_code: The email or code of the customer.
 
+        note::
+
+            A successful response is reused for 2 seconds. Updating, validating, whitelisting or
+            blacklisting a customer, or deactivating an authorization, through this client clears it.
+
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return await self._get_request(f"/customer/{email_or_code}")
+        return await self._get_request(f"{_CUSTOMER_ENDPOINT}/{email_or_code}")
 
     async def list_customers(
             self,
@@ -178,8 +193,8 @@ class AsyncCustomerClientAPI(AsyncRequestAPI):
         """
 
         # convert date  to string
-        from_date = self._convert_to_string(from_date)
-        to_date = self._convert_to_string(to_date)
+        from_date = self._date_to_string(from_date)
+        to_date = self._date_to_string(to_date)
 
         params = {"perPage": per_page, "page": page, "from": from_date, "to": to_date}
-        return await self._get_request("/customer", params=params)
+        return await self._get_request(_CUSTOMER_ENDPOINT, params=params)
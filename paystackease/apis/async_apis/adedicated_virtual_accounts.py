@@ -5,11 +5,17 @@ The Dedicated Virtual Account API enables Nigerian merchants to manage unique pa
 """
 
 from datetime import date
-from typing import Optional, Union
+from functools import partial
+from typing import Optional, Union, Dict, List, Any
 
-from paystackease.core import AsyncRequestAPI, PayStackResponse
+from paystackease.core import cached_response, AsyncRequestAPI, PayStackResponse
 from paystackease.helpers import Currency
 
+_DVA_ENDPOINT = "/dedicated_account"
+_DVA_SPLIT = _DVA_ENDPOINT + "/split"
+_DVA_REQUERY = _DVA_ENDPOINT + "/requery"
+_DVA_PROVIDERS = _DVA_ENDPOINT + "/available_providers"
+
 
 class AsyncDedicatedVirtualAccountClientAPI(AsyncRequestAPI):
     """
@@ -59,7 +65,7 @@ class AsyncDedicatedVirtualAccountClientAPI(AsyncRequestAPI):
             "last_name": last_name,
             "phone": phone,
         }
-        return await self._post_request("/dedicated_account", data=data)
+        return await self._post_request(_DVA_ENDPOINT, data=data)
 
     async def assign_dedicated_virtual_account(
             self,
@@ -116,7 +122,30 @@ class AsyncDedicatedVirtualAccountClientAPI(AsyncRequestAPI):
             "subaccount": subaccount,
             "split_code": split_code,
         }
-        return await self._post_request("/dedicated_account", data=data)
+        return await self._post_request(_DVA_ENDPOINT, data=data)
+
+    async def bulk_assign_dedicated_virtual_account(
+            self,
+            payloads: List[Dict[str, Any]],
+            concurrency: int = 10,
+    ) -> List[Union[PayStackResponse, BaseException]]:
+        """
+        Assign dedicated virtual accounts to many customers concurrently
+
+        :param: payloads: The keyword arguments of assign_dedicated_virtual_account for each customer
+        :param: concurrency: The maximum number of requests sent to Paystack at once
+
+        note::
+
+            A failed assignment does not stop the others, the error raised is returned in its place.
+
+        :return: The PayStackResponse, or the error raised, for each payload in order
+        :rtype: list
+        """
+        return await self._gather_requests(
+            (partial(self.assign_dedicated_virtual_account, **payload) for payload in payloads),
+            concurrency=concurrency,
+        )
 
     async def list_dedicated_account(
             self,
@@ -139,7 +168,7 @@ class AsyncDedicatedVirtualAccountClientAPI(AsyncRequestAPI):
         :rtype: PayStackResponse object
         """
         # convert date to string
-        active = self._convert_to_string(active)
+        active = self._bool_to_string(active)
 
         params = {
             "active": active,
@@ -148,7 +177,7 @@ class AsyncDedicatedVirtualAccountClientAPI(AsyncRequestAPI):
             "bank_id": bank_id,
             "customer": customer_id,
         }
-        return await self._get_request("/dedicated_account", params=params)
+        return await self._get_request(_DVA_ENDPOINT, params=params)
 
     async def fetch_dedicated_account(self, dedicated_account_id: int) -> PayStackResponse:
         """
@@ -159,7 +188,7 @@ class AsyncDedicatedVirtualAccountClientAPI(AsyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return await self._get_request(f"/dedicated_account/{dedicated_account_id}")
+        return await self._get_request(f"{_DVA_ENDPOINT}/{dedicated_account_id}")
 
     async def requery_dedicated_account(
             self,
@@ -179,14 +208,14 @@ class AsyncDedicatedVirtualAccountClientAPI(AsyncRequestAPI):
         """
 
         # convert date to string
-        date_transfer = self._convert_to_string(date_transfer)
+        date_transfer = self._date_to_string(date_transfer)
 
         params = {
             "account_number": account_number,
             "provider_slug": provider_slug,
             "date": date_transfer,
         }
-        return await self._get_request("/dedicated_account/requery", params=params)
+        return await self._get_request(_DVA_REQUERY, params=params)
 
     async def deactivate_dedicated_account(self, dedicated_account_id: int) -> PayStackResponse:
         """
@@ -197,7 +226,7 @@ class AsyncDedicatedVirtualAccountClientAPI(AsyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return await self._delete_request(f"/dedicated_account/{dedicated_account_id}")
+        return await self._delete_request(f"{_DVA_ENDPOINT}/{dedicated_account_id}")
 
     async def split_dedicated_account(
             self,
@@ -223,7 +252,7 @@ class AsyncDedicatedVirtualAccountClientAPI(AsyncRequestAPI):
             "subaccount": subaccount,
             "split_code": split_code,
         }
-        return await self._post_request("/dedicated_account/split", data=data)
+        return await self._post_request(_DVA_SPLIT, data=data)
 
     async def remove_split_dedicated_account(self, account_number: str) -> PayStackResponse:
         """
@@ -237,8 +266,9 @@ class AsyncDedicatedVirtualAccountClientAPI(AsyncRequestAPI):
         data = {
             "account_number": account_number,
         }
-        return await self._delete_request("/dedicated_account/split", data=data)
+        return await self._delete_request(_DVA_SPLIT, data=data)
 
+    @cached_response(ttl=86400)
     async def fetch_bank_providers(self) -> PayStackResponse:
         """
         Fetch bank providers
@@ -246,4 +276,4 @@ class AsyncDedicatedVirtualAccountClientAPI(AsyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return await self._get_request("/dedicated_account/available_providers")
+        return await self._get_request(_DVA_PROVIDERS)
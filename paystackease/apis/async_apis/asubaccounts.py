@@ -6,11 +6,13 @@ Subaccounts can be used to split payment between two accounts (your main account
 """
 
 from datetime import date
-from typing import Optional, Dict, List, Any, Union
+from typing import Optional, Dict, List, Any, Union, AsyncIterator
 
 from paystackease.core import AsyncRequestAPI, PayStackResponse
 from paystackease.helpers import SettlementSchedule
 
+_SUBACCOUNT_ENDPOINT = "/subaccount"
+
 
 class AsyncSubAccountClientAPI(AsyncRequestAPI):
     """
@@ -57,7 +59,7 @@ class AsyncSubAccountClientAPI(AsyncRequestAPI):
             "primary_contact_phone": primary_contact_phone,
             "metadata": metadata,
         }
-        return await self._post_request("/subaccount", data=data)
+        return await self._post_request(_SUBACCOUNT_ENDPOINT, data=data)
 
     async def update_subaccount(
             self,
@@ -100,7 +102,7 @@ class AsyncSubAccountClientAPI(AsyncRequestAPI):
         """
 
         # convert bool to string
-        active = self._convert_to_string(active)
+        active = self._bool_to_string(active)
 
         data = {
             "business_name": business_name,
@@ -115,7 +117,7 @@ class AsyncSubAccountClientAPI(AsyncRequestAPI):
             "settlement_schedule": settlement_schedule,
             "metadata": metadata,
         }
-        return await self._put_request(f"/subaccount/{id_or_code}", data=data)
+        return await self._put_request(f"{_SUBACCOUNT_ENDPOINT}/{id_or_code}", data=data)
 
     async def list_subaccounts(
             self,
@@ -141,7 +143,30 @@ class AsyncSubAccountClientAPI(AsyncRequestAPI):
         to_date = self._convert_to_string(to_date)
 
         params = {"perPage": per_page, "page": page, "from": from_date, "to": to_date}
-        return await self._get_request("/subaccount", params=params)
+        return await self._get_request(_SUBACCOUNT_ENDPOINT, params=params)
+
+    def iter_subaccounts(
+            self,
+            per_page: int = 50,
+            from_date: Optional[Union[date, None]] = None,
+            to_date: Optional[Union[date, None]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all subaccounts, fetching one page at a time
+
+        :param: per_page: The number of records to fetch per request.
+        :param: from_date:
+        :param: to_date:
+
+        :raise TypeValueError: if per_page is below 1
+        :raise PayStackError: if a page could not be fetched
+
+        :return: An async iterator over the subaccounts
+        :rtype: AsyncIterator[dict]
+        """
+        return self._iter_pages(
+            self.list_subaccounts, per_page=per_page, from_date=from_date, to_date=to_date
+        )
 
     async def fetch_subaccount(self, id_or_code: str) -> PayStackResponse:
         """
@@ -152,4 +177,4 @@ class AsyncSubAccountClientAPI(AsyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return await self._get_request(f"/subaccount/{id_or_code}")
+        return await self._get_request(f"{_SUBACCOUNT_ENDPOINT}/{id_or_code}")
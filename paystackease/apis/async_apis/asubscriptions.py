@@ -5,10 +5,14 @@ The Subscriptions API allows you to create and manage recurring payment on your
 """
 
 from datetime import date
-from typing import Optional, Union
+from typing import Optional, Union, AsyncIterator, Dict, Any
 
 from paystackease.core import AsyncRequestAPI, PayStackResponse
 
+_SUBSCRIPTION_ENDPOINT = "/subscription"
+_SUBSCRIPTION_ENABLE = _SUBSCRIPTION_ENDPOINT + "/enable"
+_SUBSCRIPTION_DISABLE = _SUBSCRIPTION_ENDPOINT + "/disable"
+
 
 class AsyncSubscriptionClientAPI(AsyncRequestAPI):
     """
@@ -36,7 +40,7 @@ class AsyncSubscriptionClientAPI(AsyncRequestAPI):
         """
 
         # convert date to string
-        start_date = self._convert_to_string(start_date)
+        start_date = self._date_to_string(start_date)
 
         data = {
             "customer": customer,
@@ -44,7 +48,7 @@ class AsyncSubscriptionClientAPI(AsyncRequestAPI):
             "authorization": authorization,
             "start_date": start_date,
         }
-        return await self._post_request("/subscription", data=data)
+        return await self._post_request(_SUBSCRIPTION_ENDPOINT, data=data)
 
     async def list_subscriptions(
             self,
@@ -70,7 +74,30 @@ class AsyncSubscriptionClientAPI(AsyncRequestAPI):
             "customer": customer,
             "plan": plan_code,
         }
-        return await self._get_request("/subscription", params=params)
+        return await self._get_request(_SUBSCRIPTION_ENDPOINT, params=params)
+
+    def iter_subscriptions(
+            self,
+            per_page: int = 50,
+            customer: Optional[Union[int, None]] = None,
+            plan_code: Optional[Union[int, None]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all the subscriptions, fetching one page at a time
+
+        :param: per_page: Number of records to fetch per request.
+        :param: customer:
+        :param: plan_code:
+
+        :raise TypeValueError: if per_page is below 1
+        :raise PayStackError: if a page could not be fetched
+
+        :return: An async iterator over the subscriptions
+        :rtype: AsyncIterator[dict]
+        """
+        return self._iter_pages(
+            self.list_subscriptions, per_page=per_page, customer=customer, plan_code=plan_code
+        )
 
     async def fetch_subscription(self, id_or_code: str) -> PayStackResponse:
         """
@@ -81,7 +108,7 @@ class AsyncSubscriptionClientAPI(AsyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return await self._get_request(f"/subscription/{id_or_code}")
+        return await self._get_request(f"{_SUBSCRIPTION_ENDPOINT}/{id_or_code}")
 
     async def enable_subscription(self, subscription_code: str, token: str) -> PayStackResponse:
         """
@@ -94,7 +121,7 @@ class AsyncSubscriptionClientAPI(AsyncRequestAPI):
         :rtype: PayStackResponse object
         """
         data = {"code": subscription_code, "token": token}
-        return await self._post_request("/subscription/enable", data=data)
+        return await self._post_request(_SUBSCRIPTION_ENABLE, data=data)
 
     async def disable_subscription(self, subscription_code: str, token: str) -> PayStackResponse:
         """
@@ -107,7 +134,7 @@ class AsyncSubscriptionClientAPI(AsyncRequestAPI):
         :rtype: PayStackResponse object
         """
         data = {"code": subscription_code, "token": token}
-        return await self._post_request("/subscription/disable", data=data)
+        return await self._post_request(_SUBSCRIPTION_DISABLE, data=data)
 
     async def generate_update_subscription(self, subscription_code: str) -> PayStackResponse:
         """
@@ -118,7 +145,7 @@ class AsyncSubscriptionClientAPI(AsyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return await self._post_request(f"/subscription/{subscription_code}/manage/link")
+        return await self._post_request(f"{_SUBSCRIPTION_ENDPOINT}/{subscription_code}/manage/link")
 
     async def send_update_subscription_link(self, subscription_code: str) -> PayStackResponse:
         """
@@ -129,4 +156,4 @@ class AsyncSubscriptionClientAPI(AsyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return await self._post_request(f"/subscription/{subscription_code}/manage/email")
+        return await self._post_request(f"{_SUBSCRIPTION_ENDPOINT}/{subscription_code}/manage/email")
@@ -4,7 +4,11 @@ Wrapper for Asynchronous Paystack Verification APIs
 The Verification API allows you to perform KYC processes.
 """
 
-from paystackease.core import AsyncRequestAPI, PayStackResponse
+from paystackease.core import cached_response, AsyncRequestAPI, PayStackResponse
+
+_RESOLVE_ACCOUNT_ENDPOINT = "/bank/resolve"
+_VALIDATE_ACCOUNT_ENDPOINT = "/bank/validate"
+_CARD_BIN_ENDPOINT = "/decision/bin"
 
 
 class AsyncVerificationClientAPI(AsyncRequestAPI):
@@ -13,6 +17,7 @@ class AsyncVerificationClientAPI(AsyncRequestAPI):
     Reference: https://paystack.com/docs/api/verification/
     """
 
+    @cached_response(ttl=3600)
     async def resolve_account(self, account_number: str, bank_code: str) -> PayStackResponse:
         """
         Confirm an account belongs to the right customer.
@@ -25,7 +30,7 @@ class AsyncVerificationClientAPI(AsyncRequestAPI):
         :rtype: PayStackResponse object
         """
         params = {"account_number": account_number, "bank_code": bank_code}
-        return await self._get_request("/bank/resolve", params=params)
+        return await self._get_request(_RESOLVE_ACCOUNT_ENDPOINT, params=params)
 
     async def validate_account(
             self,
@@ -62,8 +67,9 @@ class AsyncVerificationClientAPI(AsyncRequestAPI):
             "document_type": document_type,
             "document_number": document_number,
         }
-        return await self._post_request("/bank/validate", data=data)
+        return await self._post_request(_VALIDATE_ACCOUNT_ENDPOINT, data=data)
 
+    @cached_response(ttl=604800)
     async def resolve_card_bin(self, bin_code: str) -> PayStackResponse:
         """
         Resolve a card BIN
@@ -73,4 +79,4 @@ class AsyncVerificationClientAPI(AsyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return await self._get_request(f"/decision/bin/{bin_code}")
+        return await self._get_request(f"{_CARD_BIN_ENDPOINT}/{bin_code}")
@@ -7,9 +7,16 @@ The Charge API allows you to configure payment channel of your choice when initi
 from datetime import date
 from typing import Optional, Dict, Any, List, Union
 
-from paystackease.core import PayStackResponse, SyncRequestAPI
+from paystackease.core import PayStackResponse, RawJSON, SyncRequestAPI
 from paystackease.helpers import PWT
 
+_CHARGE_ENDPOINT = "/charge"
+_CHARGE_SUBMIT_PIN = _CHARGE_ENDPOINT + "/submit_pin"
+_CHARGE_SUBMIT_OTP = _CHARGE_ENDPOINT + "/submit_otp"
+_CHARGE_SUBMIT_PHONE = _CHARGE_ENDPOINT + "/submit_phone"
+_CHARGE_SUBMIT_BIRTHDAY = _CHARGE_ENDPOINT + "/submit_birthday"
+_CHARGE_SUBMIT_ADDRESS = _CHARGE_ENDPOINT + "/submit_address"
+
 
 class ChargesClientAPI(SyncRequestAPI):
     """
@@ -21,7 +28,7 @@ class ChargesClientAPI(SyncRequestAPI):
             self,
             email: str,
             amount: int,
-            metadata: Dict[str, List[Dict[str, Any]]],
+            metadata: Union[Dict[str, List[Dict[str, Any]]], RawJSON],
             authorization_code: Optional[Union[str, None]] = None,
             pin: Optional[Union[int, None]] = None,
             reference: Optional[Union[str, None]] = None,
@@ -47,6 +54,7 @@ class ChargesClientAPI(SyncRequestAPI):
         :param: mobile_money (Set Keys as: {phone, provider}, and value {phone_number, MobileMoney.value.value})
         :param: device_id
         :param: metadata A JSON object, which is passed as-is to your integration API
+            A RawJSON of the metadata already encoded is sent without being encoded again.
 
         note::
 
@@ -81,7 +89,18 @@ class ChargesClientAPI(SyncRequestAPI):
             "mobile_money": mobile_money,
             "device_id": device_id,
         }
-        return self._post_request("/charge", data=data)
+        return self._post_request(_CHARGE_ENDPOINT, data=data)
+
+    def _submit(self, path: str, field: str, value: Any, reference: str) -> PayStackResponse:
+        """
+        Submit the single value a charge step asks for
+        :param path: The submit endpoint of the step
+        :param field: The name of the value in the request body
+        :param value:
+        :param reference:
+        :return:
+        """
+        return self._post_request(path, data={field: value, "reference": reference})
 
     def submit_pin(self, pin: int, reference: str) -> PayStackResponse:
         """
@@ -93,11 +112,7 @@ class ChargesClientAPI(SyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        data = {
-            "pin": pin,
-            "reference": reference,
-        }
-        return self._post_request("/charge/submit_pin", data=data)
+        return self._submit(_CHARGE_SUBMIT_PIN, "pin", pin, reference)
 
     def submit_otp(self, otp: int, reference: str) -> PayStackResponse:
         """
@@ -109,11 +124,7 @@ class ChargesClientAPI(SyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        data = {
-            "otp": otp,
-            "reference": reference,
-        }
-        return self._post_request("/charge/submit_otp", data=data)
+        return self._submit(_CHARGE_SUBMIT_OTP, "otp", otp, reference)
 
     def submit_phone(self, phone: str, reference: str) -> PayStackResponse:
         """
@@ -125,11 +136,7 @@ class ChargesClientAPI(SyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        data = {
-            "phone": phone,
-            "reference": reference,
-        }
-        return self._post_request("/charge/submit_phone", data=data)
+        return self._submit(_CHARGE_SUBMIT_PHONE, "phone", phone, reference)
 
     def submit_birthday(self, birthday: date, reference: str) -> PayStackResponse:
         """
@@ -145,13 +152,7 @@ class ChargesClientAPI(SyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        birthday = self._convert_to_string(birthday)
-
-        data = {
-            "birthday": birthday,
-            "reference": reference,
-        }
-        return self._post_request("/charge/submit_birthday", data=data)
+        return self._submit(_CHARGE_SUBMIT_BIRTHDAY, "birthday", self._convert_to_string(birthday), reference)
 
     def submit_address(
             self, reference: str, address: str, city: str, state: str, zipcode: str
@@ -175,7 +176,7 @@ class ChargesClientAPI(SyncRequestAPI):
             "state": state,
             "zip_code": zipcode,
         }
-        return self._post_request("/charge/submit_address", data=data)
+        return self._post_request(_CHARGE_SUBMIT_ADDRESS, data=data)
 
     def check_pending_charge(self, reference: str) -> PayStackResponse:
         """
@@ -186,4 +187,4 @@ class ChargesClientAPI(SyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return self._get_request(f"/charge/{reference}")
+        return self._get_request(f"{_CHARGE_ENDPOINT}/{reference}")
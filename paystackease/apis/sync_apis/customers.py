@@ -7,9 +7,13 @@ The Customers API allows you to create and manage customers on your integration.
 from datetime import date
 from typing import Optional, Dict, Any, Union
 
-from paystackease.core import PayStackResponse, SyncRequestAPI
+from paystackease.core import PayStackResponse, RawJSON, SyncRequestAPI
 from paystackease.helpers import RiskAction
 
+_CUSTOMER_ENDPOINT = "/customer"
+_CUSTOMER_SET_RISK_ACTION = _CUSTOMER_ENDPOINT + "/set_risk_action"
+_CUSTOMER_DEACTIVATE_AUTHORIZATION = _CUSTOMER_ENDPOINT + "/deactivate_authorization"
+
 
 class CustomerClientAPI(SyncRequestAPI):
     """
@@ -23,7 +27,7 @@ class CustomerClientAPI(SyncRequestAPI):
             first_name: str, 
             last_name: str, 
             phone: str, 
-            metadata: Optional[Union[Dict[str, Any], None]] = None
+            metadata: Optional[Union[Dict[str, Any], RawJSON, None]] = None
     ) -> PayStackResponse:
         """
         Create a customer
@@ -32,7 +36,7 @@ class CustomerClientAPI(SyncRequestAPI):
         :param: first_name: The first name of the customer.
         :param: last_name: The last name of the customer.
         :param: phone: The phone number of the customer.
-        :param: metadata: The metadata of the customer in JSON format.
+        :param: metadata: The metadata of the customer in JSON format, or a RawJSON of it already encoded.
 
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
@@ -44,7 +48,7 @@ class CustomerClientAPI(SyncRequestAPI):
             "phone": phone,
             "metadata": metadata,
         }
-        return self._post_request("/customer", data=data)
+        return self._post_request(_CUSTOMER_ENDPOINT, data=data)
 
     def validate_customer(
             self,
@@ -87,7 +91,7 @@ class CustomerClientAPI(SyncRequestAPI):
             "bank_code": bank_code,
             "account_number": account_number,
         }
-        return self._post_request(f"customer/{email_or_code}/identification", data=data)
+        return self._post_request(f"{_CUSTOMER_ENDPOINT}/{email_or_code}/identification", data=data)
 
     def whitelist_blacklist_customer(
             self, email_or_code: str, risk_action: Optional[Union[RiskAction, None]] = None
@@ -105,7 +109,7 @@ class CustomerClientAPI(SyncRequestAPI):
             "customer": email_or_code,
             "risk_action": risk_action
         }
-        return self._post_request("/customer/set_risk_action", data=data)
+        return self._post_request(_CUSTOMER_SET_RISK_ACTION, data=data)
 
     def deactivate_authorization(self, authorization_code: str) -> PayStackResponse:
         """
@@ -117,7 +121,7 @@ class CustomerClientAPI(SyncRequestAPI):
         :rtype: PayStackResponse object
         """
         data = {"authorization_code": authorization_code}
-        return self._post_request("/customer/deactivate_authorization", data=data)
+        return self._post_request(_CUSTOMER_DEACTIVATE_AUTHORIZATION, data=data)
 
     def update_customer(
             self,
@@ -125,7 +129,7 @@ class CustomerClientAPI(SyncRequestAPI):
             first_name: Optional[Union[str, None]] = None,
             last_name: Optional[Union[str, None]] = None,
             phone: Optional[Union[str, None]] = None,
-            metadata: Optional[Union[Dict[str, Any], None]] = None
+            metadata: Optional[Union[Dict[str, Any], RawJSON, None]] = None
     ) -> PayStackResponse:
         """
         Update a customer
@@ -135,6 +139,7 @@ class CustomerClientAPI(SyncRequestAPI):
         :param: last_name: The last name of the customer.
         :param: phone: The phone number of the customer.
         :param: metadata: The metadata of the customer in JSON format. {"key1": "value1", "key2": "value2"}
+            A RawJSON of the metadata already encoded is sent as-is.
 
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
@@ -145,7 +150,7 @@ class CustomerClientAPI(SyncRequestAPI):
             "phone": phone,
             "metadata": metadata,
         }
-        return self._put_request(f"/customer/{customer_code}", data=data)
+        return self._put_request(f"{_CUSTOMER_ENDPOINT}/{customer_code}", data=data)
 
     def fetch_customer(self, email_or_code: str) -> PayStackResponse:
         """
@@ -156,7 +161,7 @@ class CustomerClientAPI(SyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return self._get_request(f"/customer/{email_or_code}")
+        return self._get_request(f"{_CUSTOMER_ENDPOINT}/{email_or_code}")
 
     def list_customers(
             self,
@@ -178,8 +183,8 @@ class CustomerClientAPI(SyncRequestAPI):
         """
 
         # convert date  to string
-        from_date = self._convert_to_string(from_date)
-        to_date = self._convert_to_string(to_date)
+        from_date = self._date_to_string(from_date)
+        to_date = self._date_to_string(to_date)
 
         params = {"perPage": per_page, "page": page, "from": from_date, "to": to_date}
-        return self._get_request("/customer", params=params)
+        return self._get_request(_CUSTOMER_ENDPOINT, params=params)
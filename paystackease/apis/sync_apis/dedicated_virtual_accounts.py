@@ -7,9 +7,14 @@ The Dedicated Virtual Account API enables Nigerian merchants to manage unique pa
 from datetime import date
 from typing import Optional, Union
 
-from paystackease.core import PayStackResponse, SyncRequestAPI
+from paystackease.core import cached_response, PayStackResponse, SyncRequestAPI
 from paystackease.helpers import Currency
 
+_DVA_ENDPOINT = "/dedicated_account"
+_DVA_SPLIT = _DVA_ENDPOINT + "/split"
+_DVA_REQUERY = _DVA_ENDPOINT + "/requery"
+_DVA_PROVIDERS = _DVA_ENDPOINT + "/available_providers"
+
 
 class DedicatedVirtualAccountClientAPI(SyncRequestAPI):
     """
@@ -59,7 +64,7 @@ class DedicatedVirtualAccountClientAPI(SyncRequestAPI):
             "last_name": last_name,
             "phone": phone,
         }
-        return self._post_request("/dedicated_account", data=data)
+        return self._post_request(_DVA_ENDPOINT, data=data)
 
     def assign_dedicated_virtual_account(
             self,
@@ -116,7 +121,7 @@ class DedicatedVirtualAccountClientAPI(SyncRequestAPI):
             "subaccount": subaccount,
             "split_code": split_code,
         }
-        return self._post_request("/dedicated_account", data=data)
+        return self._post_request(_DVA_ENDPOINT, data=data)
 
     def list_dedicated_account(
             self,
@@ -139,7 +144,7 @@ class DedicatedVirtualAccountClientAPI(SyncRequestAPI):
         :rtype: PayStackResponse object
         """
         # convert date to string
-        active = self._convert_to_string(active)
+        active = self._bool_to_string(active)
 
         params = {
             "active": active,
@@ -148,7 +153,7 @@ class DedicatedVirtualAccountClientAPI(SyncRequestAPI):
             "bank_id": bank_id,
             "customer": customer_id,
         }
-        return self._get_request("/dedicated_account", params=params)
+        return self._get_request(_DVA_ENDPOINT, params=params)
 
     def fetch_dedicated_account(self, dedicated_account_id: int) -> PayStackResponse:
         """
@@ -159,7 +164,7 @@ class DedicatedVirtualAccountClientAPI(SyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return self._get_request(f"/dedicated_account/{dedicated_account_id}")
+        return self._get_request(f"{_DVA_ENDPOINT}/{dedicated_account_id}")
 
     def requery_dedicated_account(
             self,
@@ -179,14 +184,14 @@ class DedicatedVirtualAccountClientAPI(SyncRequestAPI):
         """
 
         # convert date to string
-        date_transfer = self._convert_to_string(date_transfer)
+        date_transfer = self._date_to_string(date_transfer)
 
         params = {
             "account_number": account_number,
             "provider_slug": provider_slug,
             "date": date_transfer,
         }
-        return self._get_request("/dedicated_account/requery", params=params)
+        return self._get_request(_DVA_REQUERY, params=params)
 
     def deactivate_dedicated_account(self, dedicated_account_id: int) -> PayStackResponse:
         """
@@ -197,7 +202,7 @@ class DedicatedVirtualAccountClientAPI(SyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return self._delete_request(f"/dedicated_account/{dedicated_account_id}")
+        return self._delete_request(f"{_DVA_ENDPOINT}/{dedicated_account_id}")
 
     def split_dedicated_account(
             self,
@@ -223,7 +228,7 @@ class DedicatedVirtualAccountClientAPI(SyncRequestAPI):
             "subaccount": subaccount,
             "split_code": split_code,
         }
-        return self._post_request("/dedicated_account/split", data=data)
+        return self._post_request(_DVA_SPLIT, data=data)
 
     def remove_split_dedicated_account(self, account_number: str) -> PayStackResponse:
         """
@@ -237,8 +242,9 @@ class DedicatedVirtualAccountClientAPI(SyncRequestAPI):
         data = {
             "account_number": account_number,
         }
-        return self._delete_request("/dedicated_account/split", data=data)
+        return self._delete_request(_DVA_SPLIT, data=data)
 
+    @cached_response(ttl=86400)
     def fetch_bank_providers(self) -> PayStackResponse:
         """
         Fetch bank providers
@@ -246,4 +252,4 @@ class DedicatedVirtualAccountClientAPI(SyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return self._get_request("/dedicated_account/available_providers")
+        return self._get_request(_DVA_PROVIDERS)
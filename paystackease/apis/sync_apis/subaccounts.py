@@ -11,6 +11,8 @@ from typing import Optional, Dict, List, Any, Union
 from paystackease.core import PayStackResponse, SyncRequestAPI
 from paystackease.helpers import SettlementSchedule
 
+_SUBACCOUNT_ENDPOINT = "/subaccount"
+
 
 class SubAccountClientAPI(SyncRequestAPI):
     """
@@ -57,7 +59,7 @@ class SubAccountClientAPI(SyncRequestAPI):
             "primary_contact_phone": primary_contact_phone,
             "metadata": metadata,
         }
-        return self._post_request("/subaccount", data=data)
+        return self._post_request(_SUBACCOUNT_ENDPOINT, data=data)
 
     def update_subaccount(
             self,
@@ -100,7 +102,7 @@ class SubAccountClientAPI(SyncRequestAPI):
         """
 
         # convert bool to string
-        active = self._convert_to_string(active)
+        active = self._bool_to_string(active)
 
         data = {
             "business_name": business_name,
@@ -115,7 +117,7 @@ class SubAccountClientAPI(SyncRequestAPI):
             "settlement_schedule": settlement_schedule,
             "metadata": metadata,
         }
-        return self._put_request(f"/subaccount/{id_or_code}", data=data)
+        return self._put_request(f"{_SUBACCOUNT_ENDPOINT}/{id_or_code}", data=data)
 
     def list_subaccounts(
             self,
@@ -141,7 +143,7 @@ class SubAccountClientAPI(SyncRequestAPI):
         to_date = self._convert_to_string(to_date)
 
         params = {"perPage": per_page, "page": page, "from": from_date, "to": to_date}
-        return self._get_request("/subaccount", params=params)
+        return self._get_request(_SUBACCOUNT_ENDPOINT, params=params)
 
     def fetch_subaccount(self, id_or_code: str) -> PayStackResponse:
         """
@@ -152,4 +154,4 @@ class SubAccountClientAPI(SyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return self._get_request(f"/subaccount/{id_or_code}")
+        return self._get_request(f"{_SUBACCOUNT_ENDPOINT}/{id_or_code}")
@@ -9,6 +9,10 @@ from typing import Optional, Union
 
 from paystackease.core import PayStackResponse, SyncRequestAPI
 
+_SUBSCRIPTION_ENDPOINT = "/subscription"
+_SUBSCRIPTION_ENABLE = _SUBSCRIPTION_ENDPOINT + "/enable"
+_SUBSCRIPTION_DISABLE = _SUBSCRIPTION_ENDPOINT + "/disable"
+
 
 class SubscriptionClientAPI(SyncRequestAPI):
     """
@@ -36,7 +40,7 @@ class SubscriptionClientAPI(SyncRequestAPI):
         """
 
         # convert date to string
-        start_date = self._convert_to_string(start_date)
+        start_date = self._date_to_string(start_date)
 
         data = {
             "customer": customer,
@@ -44,7 +48,7 @@ class SubscriptionClientAPI(SyncRequestAPI):
             "authorization": authorization,
             "start_date": start_date,
         }
-        return self._post_request("/subscription", data=data)
+        return self._post_request(_SUBSCRIPTION_ENDPOINT, data=data)
 
     def list_subscriptions(
             self,
@@ -70,7 +74,7 @@ class SubscriptionClientAPI(SyncRequestAPI):
             "customer": customer,
             "plan": plan_code,
         }
-        return self._get_request("/subscription", params=params)
+        return self._get_request(_SUBSCRIPTION_ENDPOINT, params=params)
 
     def fetch_subscription(self, id_or_code: str) -> PayStackResponse:
         """
@@ -81,7 +85,7 @@ class SubscriptionClientAPI(SyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return self._get_request(f"/subscription/{id_or_code}")
+        return self._get_request(f"{_SUBSCRIPTION_ENDPOINT}/{id_or_code}")
 
     def enable_subscription(self, subscription_code: str, token: str) -> PayStackResponse:
         """
@@ -94,7 +98,7 @@ class SubscriptionClientAPI(SyncRequestAPI):
         :rtype: PayStackResponse object
         """
         data = {"code": subscription_code, "token": token}
-        return self._post_request("/subscription/enable", data=data)
+        return self._post_request(_SUBSCRIPTION_ENABLE, data=data)
 
     def disable_subscription(self, subscription_code: str, token: str) -> PayStackResponse:
         """
@@ -107,7 +111,7 @@ class SubscriptionClientAPI(SyncRequestAPI):
         :rtype: PayStackResponse object
         """
         data = {"code": subscription_code, "token": token}
-        return self._post_request("/subscription/disable", data=data)
+        return self._post_request(_SUBSCRIPTION_DISABLE, data=data)
 
     def generate_update_subscription(self, subscription_code: str) -> PayStackResponse:
         """
@@ -118,7 +122,7 @@ class SubscriptionClientAPI(SyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return self._post_request(f"/subscription/{subscription_code}/manage/link")
+        return self._post_request(f"{_SUBSCRIPTION_ENDPOINT}/{subscription_code}/manage/link")
 
     def send_update_subscription_link(self, subscription_code: str) -> PayStackResponse:
         """
@@ -129,4 +133,4 @@ class SubscriptionClientAPI(SyncRequestAPI):
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return self._post_request(f"/subscription/{subscription_code}/manage/email")
+        return self._post_request(f"{_SUBSCRIPTION_ENDPOINT}/{subscription_code}/manage/email")
@@ -4,6 +4,8 @@ Wrapper for Paystack Transfer Control APIs
 The Transfers Control API allows you manage settings of your transfers.
 """
 
+from typing import Optional
+
 from paystackease.core import PayStackResponse, SyncRequestAPI
 
 
@@ -13,6 +15,31 @@ class TransferControlClientAPI(SyncRequestAPI):
     Reference: https://paystack.com/docs/api/transfer-control/
     """
 
+    # Last OTP setting confirmed by Paystack, and the response that confirmed it
+    _otp_enabled: Optional[bool] = None
+    _otp_response: Optional[PayStackResponse] = None
+
+    def _set_otp_state(self, enabled: bool, response: PayStackResponse) -> PayStackResponse:
+        """
+        Remember the OTP setting if the request succeeded
+        :param enabled:
+        :param response:
+        :return:
+        """
+        if response.status:
+            self._otp_enabled = enabled
+            self._otp_response = response
+        return response
+
+    def clear_cache(self) -> None:
+        """
+        Clear the cached responses and the last known OTP setting
+        :return:
+        """
+        super().clear_cache()
+        self._otp_enabled = None
+        self._otp_response = None
+
     def check_balance(self) -> PayStackResponse:
         """
         Get the available balance
@@ -50,6 +77,11 @@ class TransferControlClientAPI(SyncRequestAPI):
         This is used in the event that you want to be able to
          complete transfers programmatically without use of OTPs
 
+        note::
+
+            Always sent, even if OTP is already known to be disabled: the last known response is
+            that of finalize_disable_otp, which is not a response of this endpoint.
+
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
@@ -65,14 +97,23 @@ class TransferControlClientAPI(SyncRequestAPI):
         :rtype: PayStackResponse object
         """
         data = {"otp": otp}
-        return self._post_request("/transfer/disable_otp_finalize", data=data)
+        response = self._post_request("/transfer/disable_otp_finalize", data=data)
+        return self._set_otp_state(False, response)
 
     def enable_otp(self) -> PayStackResponse:
         """
         This is used in the event that you want to stop
         being able to complete transfers programmatically with use of OTPs
 
+        note::
+
+            Returns the last response without a request if OTP is already known to be enabled.
+            Call clear_cache() if the setting was changed elsewhere, e.g. on the dashboard.
+
         :return: The PayStackResponse from the API
         :rtype: PayStackResponse object
         """
-        return self._post_request("/transfer/enable_otp")
+        if self._otp_enabled is True:
+            return self._otp_response
+        response = self._post_request("/transfer/enable_otp")
+        return self._set_otp_state(True, response)
@@ -1,8 +1,11 @@
 """ Getting the wrapper modules for request and response"""
 from paystackease.core._api_base import BaseAPI
+from paystackease.core._api_cache import cached_response, invalidates_cached
 from paystackease.core._api_base_client import AsyncBaseClientAPI, SyncBaseClientAPI
 from paystackease.core._api_client_requests import SyncRequestAPI, AsyncRequestAPI
 from paystackease.core._api_client_response import PayStackResponse
+from paystackease.core._api_connector import configure, close_shared_connector
+from paystackease.core._api_json import RawJSON
 from paystackease.core._api_errors import (
     APIConnectionError,
     InvalidRequestMethodError,
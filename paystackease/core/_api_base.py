@@ -12,12 +12,20 @@ from urllib.parse import urljoin
 
 from paystackease.core._api_client_response import PayStackResponse
 
-from paystackease.core._api_errors import TypeValueError
+from paystackease.core._api_errors import PayStackError, TypeValueError
 from paystackease.core._api_env import EnvConfig, EnvBase
+from paystackease.core._api_json import loads
 
 
 logger = logging.getLogger(__name__)
 
+# each supported type is mapped to its corresponding conversion function
+_CONVERSION_FUNCTIONS = {
+    bool: lambda val: str(val).lower(),
+    date: lambda val: val.strftime("%Y-%m-%d"),
+    datetime: lambda val: val.strftime("%Y-%m-%d %H:%M:%S"),  # Added a datetime
+}
+
 
 class BaseAPI(ABC):
     """Base Client API for Paystack API"""
@@ -29,6 +37,14 @@ class BaseAPI(ABC):
     def __init__(self, secret_key: EnvBase = EnvConfig()) -> None:
         self._secret_key = secret_key
         self._headers = self._make_paystack_http_headers()
+        self._response_cache: Dict[Any, Any] = {}
+
+    def clear_cache(self) -> None:
+        """
+        Clear the cached responses of idempotent endpoints
+        :return:
+        """
+        self._response_cache.clear()
 
     def _join_url(self, path: str) -> str:
         """
@@ -50,6 +66,38 @@ class BaseAPI(ABC):
             "content-type": "application/json",
         }
 
+    @staticmethod
+    def _decode_response(body: bytes, status_code: int) -> Dict[str, Any]:
+        """
+        Decode the JSON body of a response from Paystack API
+        :param body: The raw response body
+        :param status_code: The HTTP status code of the response
+
+        :raise PayStackError: if the body is not valid JSON
+
+        :return: The decoded response body
+        """
+        try:
+            return loads(body)
+        except ValueError as error:
+            error_message = f"Invalid JSON response: {error}"
+            logger.error(error_message)
+            raise PayStackError(message=error_message, status_code=status_code, http_body=body) from error
+
+    @staticmethod
+    def _compact(
+            payload: Optional[Union[Dict[str, Any], List[Any], None]]
+    ) -> Optional[Union[Dict[str, Any], List[Any], None]]:
+        """
+        Drop the keys of a request payload whose value is None
+        :param payload: The params or data to be sent
+
+        :return: The payload without the None values
+        """
+        if isinstance(payload, dict):
+            return {key: value for key, value in payload.items() if value is not None}
+        return payload
+
     @staticmethod
     def _convert_to_string(
             value: Union[bool, date, datetime, None]
@@ -58,26 +106,50 @@ class BaseAPI(ABC):
         Convert the type of value to a string
         :param value: The value to be converted
 
-        :raise TypeError: if the value is not a supported type
+        :raise TypeValueError: if the value is not a supported type
 
         :return: The value as a string
         :rtype: str
         """
-        # each supported type is mapped to its corresponding conversion function
-        conversion_functions = {
-            bool: lambda val: str(val).lower(),
-            date: lambda val: val.strftime("%Y-%m-%d"),
-            datetime: lambda val: val.strftime("%Y-%m-%d %H:%M:%S"),  # Added a datetime
-        }
-
         if value is None:
             return None
-        if type(value) in conversion_functions:
-            return conversion_functions[type(value)](value)
+        conversion_function = _CONVERSION_FUNCTIONS.get(type(value))
+        if conversion_function is not None:
+            return conversion_function(value)
         error_message = f"Unsupported type: {type(value)}. Expected type -bool, -date, -datetime"
         logger.error(error_message)
         raise TypeValueError(error_message)
 
+    @classmethod
+    def _bool_to_string(cls, value: Optional[bool]) -> Optional[str]:
+        """
+        Convert a bool to a string, skipping the type lookup of _convert_to_string
+        :param value: The bool to be converted
+
+        :raise TypeValueError: if the value is not a bool or None
+
+        :return: "true", "false" or None
+        """
+        if value is True:
+            return "true"
+        if value is False:
+            return "false"
+        return cls._convert_to_string(value)
+
+    @classmethod
+    def _date_to_string(cls, value: Union[date, datetime, None]) -> Optional[str]:
+        """
+        Convert a date to a string, skipping the type lookup of _convert_to_string
+        :param value: The date to be converted
+
+        :raise TypeValueError: if the value is not a date, datetime or None
+
+        :return: The date as YYYY-MM-DD, or datetime as YYYY-MM-DD HH:MM:SS
+        """
+        if type(value) is date:  # pylint: disable=unidiomatic-typecheck
+            return value.isoformat()
+        return cls._convert_to_string(value)
+
     @abstractmethod
     def _request_url(
         self,
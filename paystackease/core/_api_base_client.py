@@ -3,7 +3,6 @@ This defines classes SyncBaseClientAPI and AsyncBaseClientAPI which are used for
 synchronous and asynchronous requests to the Paystack API, respectively.
 """
 
-import json
 import logging
 
 from typing import Union, Dict, List, Any, Optional
@@ -14,12 +13,16 @@ from aiohttp import (
 from requests import (
     Session, RequestException, ConnectionError
 )
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from paystackease.core._api_base import BaseAPI
 from paystackease.core._api_client_response import PayStackResponse
+from paystackease.core._api_connector import get_shared_connector
 from paystackease.core._api_errors import (
     InvalidRequestMethodError, PayStackError, APIConnectionError, PayStackServerError
 )
+from paystackease.core._api_json import dumps
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +32,38 @@ class SyncBaseClientAPI(BaseAPI):
     # pylint: disable=too-few-public-methods
     def __init__(self, session: Optional[Session] = None) -> None:
         super().__init__()
-        self._session = session or Session()
+        self._owns_session = session is None
+        self._session = session or self._make_session()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @staticmethod
+    def _make_session() -> Session:
+        """
+        Make a session that keeps a pool of keep-alive connections to Paystack
+        :return:
+        """
+        session = Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        )
+        session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retries))
+        return session
+
+    def close(self) -> None:
+        """
+        Close the session if it was created by this client
+        :return:
+        """
+        if self._owns_session:
+            self._session.close()
 
     def _request_url(
         self,
@@ -55,12 +89,9 @@ class SyncBaseClientAPI(BaseAPI):
 
         url = self._join_url(url)
         # Filtering params and data, then converting data to JSON
-        params = (
-            {key: value for key, value in params.items() if value is not None}
-            if params
-            else None
-        )
-        data = json.dumps(data) if data else None
+        params = self._compact(params) or None
+        data = self._compact(data)
+        data = dumps(data) if data else None
         try:
             with self._session.request(
                 method,
@@ -71,7 +102,7 @@ class SyncBaseClientAPI(BaseAPI):
                 **kwargs,
                 timeout=30,
             ) as response:
-                response_data = response.json()
+                response_data = self._decode_response(response.content, response.status_code)
                 logger.info("Response Status Code: %s", response.status_code)
                 logger.info("Response JSON: %s", response_data)
 
@@ -107,15 +138,77 @@ class AsyncBaseClientAPI(BaseAPI):
         super().__init__()
 
         self.timeout = timeout or ClientTimeout(total=30)
-        self._session = session or ClientSession(
-            headers=self._make_paystack_http_headers(), timeout=self.timeout
-        )
+        # The session is created lazily inside the running event loop and then
+        # reused for every request, so keep-alive connections are not thrown away.
+        self._session: Optional[ClientSession] = session
+        self._owns_session = session is None
+        # Requests of cached methods that are still waiting for Paystack, see cached_response
+        self._pending_requests: Dict[Any, Any] = {}
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        if not self._session.closed:
+        await self.aclose()
+
+    def clear_cache(self) -> None:
+        """
+        Clear the cached responses of idempotent endpoints,
+        requests still in flight finish without being cached
+        :return:
+        """
+        super().clear_cache()
+        self._pending_requests.clear()
+
+    async def _get_session(self) -> ClientSession:
+        """
+        Get the client session, creating it on first use or when the session in use was closed,
+        e.g. because configure() closed the pool it was drawing from
+        :return:
+        """
+        if self._session is None or self._session.closed:
+            self._session = self._make_session()
+            self._owns_session = True
+        return self._session
+
+    def _make_session(self) -> ClientSession:
+        """
+        Make a session with the Paystack headers, drawing from the shared connection pool
+        :return:
+        """
+        return ClientSession(
+            headers=self._headers,
+            timeout=self.timeout,
+            connector=get_shared_connector(),
+            connector_owner=False,
+        )
+
+    async def _use_session(self, session: ClientSession) -> None:
+        """
+        Borrow a session shared with other clients, closing the session this client created
+        :param session:
+        :return:
+        """
+        await self.aclose()
+        self._session = session
+        self._owns_session = False
+
+    def _release_session(self, session: ClientSession) -> None:
+        """
+        Stop borrowing the session, a session is created again on the next request
+        :param session: The shared session being closed
+        :return:
+        """
+        if not self._owns_session and self._session is session:
+            self._session = None
+            self._owns_session = True
+
+    async def aclose(self) -> None:
+        """
+        Close the client session if it was created by this client
+        :return:
+        """
+        if self._owns_session and self._session is not None and not self._session.closed:
             await self._session.close()
 
     async def _request_url(
@@ -142,22 +235,22 @@ class AsyncBaseClientAPI(BaseAPI):
 
         url = self._join_url(url)
         # Filtering params and data, then converting data to JSON
-        params = (
-            {key: value for key, value in params.items() if value is not None}
-            if params
-            else None
-        )
-        data = json.dumps(data) if data else None
+        params = self._compact(params) or None
+        data = self._compact(data)
+        data = dumps(data) if data else None
 
+        session = await self._get_session()
         try:
-            async with self._session.request(
+            async with session.request(
                 method,
                 url=url,
+                # A session passed in by the caller does not carry the Paystack headers
+                headers=None if self._owns_session else self._headers,
                 data=data,
                 params=params,
                 **kwargs,
             ) as response:
-                response_data = await response.json()
+                response_data = self._decode_response(await response.read(), response.status)
                 logger.info("Response Status Code: %s", response.status)
                 logger.info("Response JSON: %s", response_data)
 
@@ -0,0 +1,199 @@
+"""
+This caches the successful responses of idempotent GET endpoints, such as bank providers
+and card BINs, so repeated lookups do not make a round trip to the Paystack API.
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from paystackease.core._api_client_response import PayStackResponse
+
+
+_MAX_ENTRIES = 256
+# Synchronous clients may be shared between threads
+_cache_lock = threading.Lock()
+
+
+def _cache_key(
+        method: Callable,
+        signature: inspect.Signature,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+) -> Hashable:
+    """
+    Make the cache key of a method call, from its bound arguments with the defaults applied,
+    so calls passing the same values positionally or by keyword share one entry
+    :param method:
+    :param signature:
+    :param args: The positional arguments, including the client
+    :param kwargs:
+    :return:
+    """
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = []
+    for name, value in list(bound.arguments.items())[1:]:
+        if signature.parameters[name].kind is inspect.Parameter.VAR_KEYWORD:
+            value = tuple(sorted(value.items()))
+        arguments.append((name, value))
+    return method.__qualname__, tuple(arguments)
+
+
+def _lookup(cache: Dict[Hashable, Tuple[float, PayStackResponse]], key: Hashable) -> Any:
+    """
+    Get a cached response, or None if it is missing or expired
+    :param cache:
+    :param key:
+    :return:
+    """
+    with _cache_lock:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            cache.pop(key, None)
+            return None
+        return response
+
+
+def _store(
+        cache: Dict[Hashable, Tuple[float, PayStackResponse]],
+        key: Hashable,
+        response: PayStackResponse,
+        ttl: float,
+) -> None:
+    """
+    Cache a successful response, evicting the oldest entry when the cache is full
+    :param cache:
+    :param key:
+    :param response:
+    :param ttl:
+    :return:
+    """
+    if ttl <= 0 or not response.status:
+        return
+    with _cache_lock:
+        if len(cache) >= _MAX_ENTRIES:
+            cache.pop(next(iter(cache)), None)
+        cache[key] = (time.monotonic() + ttl, response)
+
+
+def _settle(
+        cache: Dict[Hashable, Tuple[float, PayStackResponse]],
+        pending: Dict[Hashable, "asyncio.Future[PayStackResponse]"],
+        key: Hashable,
+        ttl: float,
+        task: "asyncio.Future[PayStackResponse]",
+) -> None:
+    """
+    Cache the response of a finished request and stop sharing it with new callers.
+    A request that was invalidated while in flight is not cached, its response may be stale.
+    :param cache:
+    :param pending:
+    :param key:
+    :param ttl:
+    :param task:
+    :return:
+    """
+    current = pending.get(key) is task
+    if current:
+        del pending[key]
+    if task.cancelled() or task.exception() is not None or not current:
+        return
+    _store(cache, key, task.result(), ttl)
+
+
+def _invalidate(client: Any, method_names: Tuple[str, ...]) -> None:
+    """
+    Drop the cached responses and in-flight requests of the named methods of a client
+    :param client:
+    :param method_names:
+    :return:
+    """
+    qualnames = {getattr(type(client), name).__qualname__ for name in method_names}
+    with _cache_lock:
+        for cache in (client._response_cache, getattr(client, "_pending_requests", {})):
+            for key in [key for key in cache if key[0] in qualnames]:
+                cache.pop(key, None)
+
+
+def cached_response(ttl: float) -> Callable:
+    """
+    Cache the successful responses of a client method for `ttl` seconds.
+    Works on both synchronous and asynchronous methods, the cache is kept per client instance.
+    Concurrent asynchronous calls with the same arguments share one request to Paystack.
+
+    :param ttl: Number of seconds a response is reused for,
+        0 only shares the requests of concurrent asynchronous calls
+    """
+
+    def decorator(method: Callable) -> Callable:
+        signature = inspect.signature(method)
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                key = _cache_key(method, signature, (self, *args), kwargs)
+                response = _lookup(self._response_cache, key)
+                if response is not None:
+                    return response
+                task = self._pending_requests.get(key)
+                if task is None:
+                    task = asyncio.ensure_future(method(self, *args, **kwargs))
+                    self._pending_requests[key] = task
+                    task.add_done_callback(
+                        functools.partial(_settle, self._response_cache, self._pending_requests, key, ttl)
+                    )
+                # A cancelled caller must not cancel the request the others are waiting on
+                return await asyncio.shield(task)
+
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = _cache_key(method, signature, (self, *args), kwargs)
+            response = _lookup(self._response_cache, key)
+            if response is None:
+                response = method(self, *args, **kwargs)
+                _store(self._response_cache, key, response, ttl)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates_cached(*method_names: str) -> Callable:
+    """
+    Drop the cached responses of the named methods of the client after a write,
+    so the next read is fetched from Paystack again.
+    Works on both synchronous and asynchronous methods.
+
+    :param method_names: Names of the cached_response methods the write makes stale
+    """
+
+    def decorator(method: Callable) -> Callable:
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                try:
+                    return await method(self, *args, **kwargs)
+                finally:
+                    _invalidate(self, method_names)
+
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                _invalidate(self, method_names)
+
+        return wrapper
+
+    return decorator
@@ -3,10 +3,14 @@ Paystackease HTTP requests and aiohttp handlers This aims to simplify the proces
 to the Paystack API by providing higher-level methods for different HTTP methods,
 """
 
-from typing import Optional, Any, Union, List, Dict
+import asyncio
+from typing import (
+    Optional, Any, Union, List, Dict, Iterable, Awaitable, AsyncIterator, Callable
+)
 
 from paystackease.core._api_base_client import SyncBaseClientAPI, AsyncBaseClientAPI
 from paystackease.core._api_client_response import PayStackResponse
+from paystackease.core._api_errors import PayStackError, TypeValueError
 
 
 class SyncRequestAPI(SyncBaseClientAPI):
@@ -44,7 +48,7 @@ class SyncRequestAPI(SyncBaseClientAPI):
         :param kwargs:
         :return:
         """
-        return self._request("GET", endpoint, params=params, **kwargs)
+        return self._request_url("GET", endpoint, params=params, **kwargs)
 
     def _post_request(
         self,
@@ -59,7 +63,7 @@ class SyncRequestAPI(SyncBaseClientAPI):
         :param kwargs:
         :return:
         """
-        return self._request("POST", endpoint, data=data, **kwargs)
+        return self._request_url("POST", endpoint, data=data, **kwargs)
 
     def _put_request(
         self,
@@ -74,7 +78,7 @@ class SyncRequestAPI(SyncBaseClientAPI):
         :param kwargs:
         :return:
         """
-        return self._request("PUT", endpoint, data=data, **kwargs)
+        return self._request_url("PUT", endpoint, data=data, **kwargs)
 
     def _delete_request(self, endpoint: str, **kwargs) -> PayStackResponse:
         """
@@ -83,7 +87,7 @@ class SyncRequestAPI(SyncBaseClientAPI):
         :param kwargs:
         :return:
         """
-        return self._request("DELETE", endpoint, **kwargs)
+        return self._request_url("DELETE", endpoint, **kwargs)
 
 
 class AsyncRequestAPI(AsyncBaseClientAPI):
@@ -123,7 +127,7 @@ class AsyncRequestAPI(AsyncBaseClientAPI):
         :param kwargs:
         :return:
         """
-        return await self._request("GET", endpoint, params=params, **kwargs)
+        return await self._request_url("GET", endpoint, params=params, **kwargs)
 
     async def _post_request(
         self,
@@ -138,7 +142,7 @@ class AsyncRequestAPI(AsyncBaseClientAPI):
         :param kwargs:
         :return:
         """
-        return await self._request("POST", endpoint, data=data, **kwargs)
+        return await self._request_url("POST", endpoint, data=data, **kwargs)
 
     async def _put_request(
         self,
@@ -153,7 +157,7 @@ class AsyncRequestAPI(AsyncBaseClientAPI):
         :param kwargs:
         :return:
         """
-        return await self._request("PUT", endpoint, data=data, **kwargs)
+        return await self._request_url("PUT", endpoint, data=data, **kwargs)
 
     async def _delete_request(self, endpoint: str, **kwargs) -> PayStackResponse:
         """
@@ -162,4 +166,66 @@ class AsyncRequestAPI(AsyncBaseClientAPI):
         :param kwargs:
         :return:
         """
-        return await self._request("DELETE", endpoint, **kwargs)
+        return await self._request_url("DELETE", endpoint, **kwargs)
+
+    @staticmethod
+    async def _gather_requests(
+        requests: Iterable[Callable[[], Awaitable[PayStackResponse]]],
+        concurrency: int = 10,
+    ) -> List[Union[PayStackResponse, BaseException]]:
+        """
+        Runs the requests concurrently, with at most `concurrency` of them in flight at once
+        :param requests: Zero-argument callables that start each request, e.g. functools.partial
+            of a client method. They are called inside the batch, so an error raised by
+            one, such as a wrong keyword argument, is returned in its place.
+        :param concurrency: The maximum number of requests in flight, at least 1
+
+        :raise TypeValueError: if concurrency is not a positive integer
+
+        :return: The response, or the error raised, of each request in order
+        """
+        if not isinstance(concurrency, int) or concurrency < 1:
+            raise TypeValueError(f"Invalid concurrency: {concurrency}. Expected an integer of at least 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _bounded(request: Callable[[], Awaitable[PayStackResponse]]) -> PayStackResponse:
+            async with semaphore:
+                return await request()
+
+        return await asyncio.gather(
+            *(_bounded(request) for request in requests), return_exceptions=True
+        )
+
+    @staticmethod
+    def _iter_pages(
+        list_method: Callable[..., Awaitable[PayStackResponse]],
+        per_page: int = 50,
+        **filters,
+    ) -> AsyncIterator[Any]:
+        """
+        Yields the items of a paginated list endpoint, requesting one page at a time
+        until a page comes back empty, since Paystack may return fewer items than per_page
+        :param list_method: The list method, called with per_page, page and the filters
+        :param per_page: The number of items requested per page, at least 1
+        :param filters:
+        :raise TypeValueError: if per_page is not a positive integer
+        :raise PayStackError: if a page could not be fetched, while iterating
+        :return:
+        """
+        if not isinstance(per_page, int) or per_page < 1:
+            raise TypeValueError(f"Invalid per_page: {per_page}. Expected an integer of at least 1")
+
+        async def _pages() -> AsyncIterator[Any]:
+            page = 1
+            while True:
+                response = await list_method(per_page=per_page, page=page, **filters)
+                if not response.status:
+                    raise PayStackError(message=response.message, status_code=response.status_code)
+                items = response.data or []
+                if not items:
+                    return
+                for item in items:
+                    yield item
+                page += 1
+
+        return _pages()
@@ -0,0 +1,107 @@
+"""
+This holds the connection pools shared by the asynchronous clients, one per event loop, so that
+warm TLS connections to the Paystack API are reused across client instances.
+"""
+
+import asyncio
+import threading
+from typing import Any, Dict
+
+from aiohttp import TCPConnector
+
+
+_connector_settings: Dict[str, Any] = {
+    "limit": 100,
+    "limit_per_host": 30,
+    "keepalive_timeout": 60,
+    "ttl_dns_cache": 300,
+    "enable_cleanup_closed": True,
+    "force_close": False,
+}
+# A connector holds its loop, so entries are removed explicitly once their loop has closed
+_shared_connectors: Dict[asyncio.AbstractEventLoop, TCPConnector] = {}
+_connectors_lock = threading.Lock()
+
+
+def _close_connector(loop: asyncio.AbstractEventLoop, connector: TCPConnector) -> None:
+    """
+    Close a connector from the thread of its event loop, so its keep-alive connections do not linger
+    :param loop: The event loop the connector was created in
+    :param connector:
+    :return:
+    """
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    # pylint: disable=protected-access
+    if loop.is_running() and loop is not running_loop:
+        # The connector's transports belong to a loop running in another thread
+        loop.call_soon_threadsafe(connector._close)
+    else:
+        # Also safe when the loop is closed, e.g. after asyncio.run() returned
+        connector._close()
+
+
+def _prune_finished_loops() -> None:
+    """
+    Close and forget the connectors of event loops that have closed, must be called with the lock held
+    :return:
+    """
+    for loop in [loop for loop in _shared_connectors if loop.is_closed()]:
+        _close_connector(loop, _shared_connectors.pop(loop))
+
+
+def configure(
+        keepalive: int = 60,
+        max_connections: int = 100,
+        max_connections_per_host: int = 30,
+) -> None:
+    """
+    Configure the connection pools used by the asynchronous clients
+
+    :param: keepalive: Seconds an idle connection is kept open for reuse
+    :param: max_connections: Total number of simultaneous connections of each pool
+    :param: max_connections_per_host: Number of simultaneous connections to the Paystack API of each pool
+
+    note::
+
+        The previous pools are closed, clients open a new session on the new pool at their next request.
+    """
+    with _connectors_lock:
+        _connector_settings.update(
+            keepalive_timeout=keepalive,
+            limit=max_connections,
+            limit_per_host=max_connections_per_host,
+        )
+        for loop, connector in _shared_connectors.items():
+            _close_connector(loop, connector)
+        _shared_connectors.clear()
+
+
+def get_shared_connector() -> TCPConnector:
+    """
+    Get the connector of the running event loop, creating it on first use
+    :return:
+    """
+    loop = asyncio.get_running_loop()
+    with _connectors_lock:
+        connector = _shared_connectors.get(loop)
+        if connector is None or connector.closed:
+            _prune_finished_loops()
+            connector = TCPConnector(**_connector_settings)
+            _shared_connectors[loop] = connector
+        return connector
+
+
+async def close_shared_connector() -> None:
+    """
+    Close the connector of the running event loop and its pooled connections
+    :return:
+    """
+    loop = asyncio.get_running_loop()
+    with _connectors_lock:
+        connector = _shared_connectors.pop(loop, None)
+        _prune_finished_loops()
+    if connector is not None:
+        await connector.close()
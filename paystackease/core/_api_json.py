@@ -0,0 +1,117 @@
+"""
+This encodes request bodies and decodes response bodies as JSON.
+orjson is used when it is installed (pip install orjson),
+otherwise the standard library json module is used.
+"""
+
+import dataclasses
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Dict, List, Tuple, Union
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class RawJSON:
+    """
+    A JSON document that is already encoded, such as metadata reused across many requests.
+    It is placed in the request body as-is instead of being encoded again.
+
+    :param data: The encoded JSON document
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Union[bytes, bytearray, str]) -> None:
+        self.data = data.encode() if isinstance(data, str) else bytes(data)
+
+    def __repr__(self) -> str:
+        return f"RawJSON({self.data!r})"
+
+
+def _default(obj: Any) -> Any:
+    """
+    Encode the values json cannot encode on its own the way orjson does natively, so a body
+    is sent the same whether orjson is installed or not. A RawJSON nested below the top level
+    of a body is decoded so it can be encoded with the rest.
+    :param obj:
+    :return:
+    """
+    if isinstance(obj, RawJSON):
+        return loads(obj.data)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode(obj: Any) -> Union[bytes, str]:
+    """
+    Encode an object to JSON with orjson, or the standard library json module
+    :param obj:
+    :return:
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default)
+
+
+def _as_bytes(document: Union[bytes, str]) -> bytes:
+    """
+    Get an encoded document as bytes
+    :param document:
+    :return:
+    """
+    return document if isinstance(document, bytes) else document.encode()
+
+
+def _splice(obj: Dict[Any, Any], raw: List[Tuple[Any, RawJSON]]) -> bytes:
+    """
+    Encode a dict, placing the encoded documents of its RawJSON values in the body as-is
+    :param obj:
+    :param raw:
+    :return:
+    """
+    body = _as_bytes(_encode({key: value for key, value in obj.items() if not isinstance(value, RawJSON)}))
+    fields = b",".join(_as_bytes(_encode(str(key))) + b":" + value.data for key, value in raw)
+    if body == b"{}":
+        return b"{" + fields + b"}"
+    return body[:-1] + b"," + fields + b"}"
+
+
+def dumps(obj: Any) -> Union[bytes, str]:
+    """
+    Encode an object to JSON
+    :param obj: The object to be encoded, RawJSON values of a dict are placed as-is
+
+    :return: The JSON document
+    """
+    if isinstance(obj, dict):
+        raw = [(key, value) for key, value in obj.items() if isinstance(value, RawJSON)]
+        if raw:
+            return _splice(obj, raw)
+    return _encode(obj)
+
+
+def loads(body: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document
+    :param body: The JSON document
+
+    :raise ValueError: if the body is not valid JSON
+
+    :return: The decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
@@ -58,6 +58,11 @@ from paystackease.apis.async_apis import (
 )
 
 
+def sent_body(payload):
+    """The JSON body a client sends for a payload, fields set to None are left out"""
+    return {key: value for key, value in payload.items() if value is not None}
+
+
 @pytest.fixture
 def env_var():
     class MockEnvConfig(EnvConfig):
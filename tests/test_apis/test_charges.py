@@ -6,7 +6,7 @@ import pytest
 import responses
 
 from paystackease.helpers.tool_kit import PWT, QRCODE
-from tests.conftest import charges_client
+from tests.conftest import charges_client, sent_body
 
 
 @pytest.mark.parametrize(
@@ -125,7 +125,7 @@ def test_create_charge(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
@@ -5,7 +5,7 @@ from datetime import date
 import pytest
 import responses
 
-from tests.conftest import customers_client
+from tests.conftest import customers_client, sent_body
 
 
 @pytest.mark.parametrize(
@@ -42,7 +42,7 @@ def test_create_customer(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
@@ -126,7 +126,7 @@ def test_validate_customer(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
@@ -151,7 +151,7 @@ def test_whitelist_blacklist_customer(customers_client, email_or_code, risk_acti
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
@@ -202,7 +202,7 @@ def test_update_customer(customers_client, first_name, last_name, phone, metadat
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body or "{}") == sent_body(expected_data)
     assert response is not None
 
 
@@ -5,7 +5,7 @@ from datetime import date
 import pytest
 import responses
 
-from tests.conftest import dva_client
+from tests.conftest import dva_client, sent_body
 
 
 @pytest.mark.parametrize(
@@ -71,7 +71,7 @@ def test_create_virtual_account(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
@@ -170,7 +170,7 @@ def test_assign_dvs(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
@@ -329,7 +329,7 @@ def test_requery_dva(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
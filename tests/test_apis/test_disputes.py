@@ -6,7 +6,7 @@ import pytest
 import responses
 
 from paystackease.helpers.tool_kit import DisputeStatus, Resolution
-from tests.conftest import disputes_client
+from tests.conftest import disputes_client, sent_body
 
 
 @pytest.mark.parametrize(
@@ -128,7 +128,7 @@ def test_update_dispute(disputes_client, refund_amount, uploaded_file):
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
@@ -192,7 +192,7 @@ def test_add_evidence(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
@@ -263,7 +263,7 @@ def test_resolve_dispute(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
@@ -5,7 +5,7 @@ from datetime import date
 import pytest
 import responses
 
-from tests.conftest import payment_pages_client
+from tests.conftest import payment_pages_client, sent_body
 
 
 @pytest.mark.parametrize(
@@ -76,7 +76,7 @@ def test_create_payment_page(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
@@ -172,7 +172,7 @@ def test_update_page(payment_pages_client, name, description, amount, active):
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
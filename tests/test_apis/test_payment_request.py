@@ -6,7 +6,7 @@ import pytest
 import responses
 
 from paystackease.helpers.tool_kit import PayMentRequestStatus
-from tests.conftest import payment_requests_client
+from tests.conftest import payment_requests_client, sent_body
 
 
 @pytest.mark.parametrize(
@@ -97,7 +97,7 @@ def test_create_payment_request(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
@@ -363,7 +363,7 @@ def test_update_payment_request(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
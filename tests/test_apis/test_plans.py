@@ -5,7 +5,7 @@ from datetime import date
 import pytest
 import responses
 
-from tests.conftest import plans_client
+from tests.conftest import plans_client, sent_body
 
 
 @pytest.mark.parametrize(
@@ -67,7 +67,7 @@ def test_create_plan(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
@@ -192,5 +192,5 @@ def test_update_plan(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
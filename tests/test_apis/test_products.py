@@ -5,7 +5,7 @@ from datetime import date
 import pytest
 import responses
 
-from tests.conftest import products_client
+from tests.conftest import products_client, sent_body
 
 
 @pytest.mark.parametrize(
@@ -46,7 +46,7 @@ def test_create_payment_request(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
@@ -148,5 +148,5 @@ def test_update_payment_request(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
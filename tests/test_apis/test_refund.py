@@ -5,7 +5,7 @@ from datetime import date
 import pytest
 import responses
 
-from tests.conftest import refund_client
+from tests.conftest import refund_client, sent_body
 
 
 @pytest.mark.parametrize(
@@ -50,7 +50,7 @@ def test_create_refund(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
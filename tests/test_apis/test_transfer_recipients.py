@@ -5,7 +5,7 @@ from datetime import date
 import pytest
 import responses
 
-from tests.conftest import transfer_recipients_client
+from tests.conftest import transfer_recipients_client, sent_body
 
 
 @pytest.mark.parametrize(
@@ -76,7 +76,7 @@ def test_create_recipient(
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
@@ -197,7 +197,7 @@ def test_update_recipient(transfer_recipients_client, recipient_name, recipient_
     )
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
-    assert json.loads(responses.calls[0].request.body) == expected_data
+    assert json.loads(responses.calls[0].request.body) == sent_body(expected_data)
     assert response is not None
 
 
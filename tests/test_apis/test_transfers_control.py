@@ -118,3 +118,32 @@ def test_enable_otp(transfers_control_client):
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == url
     assert response is not None
+
+
+@responses.activate
+def test_enable_otp_is_not_repeated(transfers_control_client):
+    """Test that enabling OTP twice only makes one request"""
+    url = "https://api.paystack.co/transfer/enable_otp"
+    responses.add(responses.POST, url, status=200, json={"status": True})
+    first = transfers_control_client.enable_otp()
+    second = transfers_control_client.enable_otp()
+    assert len(responses.calls) == 1
+    assert second is first
+    transfers_control_client.clear_cache()
+    transfers_control_client.enable_otp()
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_disable_otp_after_finalize_is_sent(transfers_control_client):
+    """Test that disabling OTP is always sent, and that enabling it again is not skipped"""
+    base_url = "https://api.paystack.co/transfer"
+    responses.add(responses.POST, f"{base_url}/disable_otp_finalize", status=200, json={"status": True})
+    responses.add(responses.POST, f"{base_url}/disable_otp", status=200, json={"status": True})
+    responses.add(responses.POST, f"{base_url}/enable_otp", status=200, json={"status": True})
+    finalized = transfers_control_client.finalize_disable_otp(otp="123")
+    disabled = transfers_control_client.disable_otp()
+    assert disabled is not finalized
+    assert responses.calls[1].request.url == f"{base_url}/disable_otp"
+    transfers_control_client.enable_otp()
+    assert len(responses.calls) == 3
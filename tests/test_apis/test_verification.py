@@ -1,10 +1,13 @@
 """ Test for synchronous Customers """
 
 import json
+import re
+import threading
 from datetime import date
 import pytest
 import responses
 
+from paystackease.core import _api_cache
 from tests.conftest import verification_client
 
 
@@ -58,6 +61,62 @@ def test_resolve_card(verification_client):
     assert response is not None
 
 
+@responses.activate
+def test_resolve_card_is_cached(verification_client):
+    """Test that a resolved card BIN is reused instead of requested again"""
+    bin_code = "test-bin-code"
+    url = f"https://api.paystack.co/decision/bin/{bin_code}"
+    responses.add(responses.GET, url, status=200, json={"status": True})
+    first = verification_client.resolve_card_bin(bin_code=bin_code)
+    second = verification_client.resolve_card_bin(bin_code=bin_code)
+    assert len(responses.calls) == 1
+    assert second is first
+    verification_client.clear_cache()
+    verification_client.resolve_card_bin(bin_code=bin_code)
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_resolve_account_positional_and_keyword_share_cache(verification_client):
+    """Test that the same lookup passed positionally or by keyword is requested once"""
+    url = "https://api.paystack.co/bank/resolve?account_number=0000000000&bank_code=053"
+    responses.add(responses.GET, url, status=200, json={"status": True})
+    first = verification_client.resolve_account("0000000000", "053")
+    second = verification_client.resolve_account(bank_code="053", account_number="0000000000")
+    third = verification_client.resolve_account("0000000000", bank_code="053")
+    assert len(responses.calls) == 1
+    assert second is first
+    assert third is first
+
+
+@responses.activate
+def test_resolve_card_cache_is_thread_safe(verification_client, monkeypatch):
+    """Test that threads evicting and expiring entries of one client do not race"""
+    monkeypatch.setattr(_api_cache, "_MAX_ENTRIES", 4)
+    responses.add(
+        responses.GET,
+        re.compile(r"https://api\.paystack\.co/decision/bin/.+"),
+        status=200,
+        json={"status": True},
+    )
+    errors = []
+
+    def resolve(start):
+        try:
+            for number in range(start, start + 50):
+                verification_client.resolve_card_bin(bin_code=str(number % 10))
+        except Exception as error:  # pylint: disable=broad-except
+            errors.append(error)
+
+    threads = [threading.Thread(target=resolve, args=(start,)) for start in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(verification_client._response_cache) <= 4
+
+
 @pytest.mark.parametrize(
     (
         "account_name",
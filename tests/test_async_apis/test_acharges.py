@@ -1,8 +1,13 @@
 """ Test for asynchornous Charges """
 
+import asyncio
+import json
+
 import pytest
 from datetime import date, datetime
+from yarl import URL
 
+from paystackease.core import PayStackServerError, TypeValueError
 from paystackease.helpers.tool_kit import PWT, QRCODE
 from tests.conftest import async_charges_client, mocked_responses
 
@@ -125,6 +130,22 @@ async def test_create_charge(
     assert response is not None
 
 
+@pytest.mark.asyncio
+async def test_create_charge_omits_unset_fields(async_charges_client, mocked_responses):
+    url = "https://api.paystack.co/charge"
+    mocked_responses.post(url, status=200, payload={"status": True, "message": "Charge attempted"})
+    await async_charges_client.create_charge(
+        email="test-email@gmail.com", amount=10000, metadata={"custom_fields": []}, pin=1234
+    )
+    (request,) = mocked_responses.requests[("POST", URL(url))]
+    assert json.loads(request.kwargs["data"]) == {
+        "email": "test-email@gmail.com",
+        "amount": 10000,
+        "metadata": {"custom_fields": []},
+        "pin": 1234,
+    }
+
+
 @pytest.mark.asyncio
 async def test_submit_pin(async_charges_client, mocked_responses):
     url = "https://api.paystack.co/charge/submit_pin"
@@ -231,3 +252,95 @@ async def test_check_pending_charge(async_charges_client, mocked_responses):
     response = await async_charges_client.check_pending_charge(reference=reference)
     mocked_responses.assert_called()
     assert response is not None
+
+
+@pytest.mark.asyncio
+async def test_check_pending_charges(async_charges_client, mocked_responses):
+    references = ["test-reference1", "test-reference2"]
+    for reference in references:
+        mocked_responses.get(
+            f"https://api.paystack.co/charge/{reference}",
+            status=200,
+            payload={"status": True, "data": {"reference": reference}},
+        )
+    responses = await async_charges_client.check_pending_charges(references, concurrency=1)
+    assert [response.data["reference"] for response in responses] == references
+
+
+@pytest.mark.asyncio
+async def test_submit_batch(async_charges_client, mocked_responses):
+    url = "https://api.paystack.co/charge/submit_otp"
+    mocked_responses.post(url, status=200, payload={"status": True})
+    mocked_responses.post(url, status=200, payload={"status": True})
+    responses = await async_charges_client.submit_batch(
+        "otp",
+        [{"otp": 123456, "reference": "test-reference1"}, {"otp": 654321, "reference": "test-reference2"}],
+    )
+    assert [response.status for response in responses] == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_invalid_step(async_charges_client):
+    with pytest.raises(TypeValueError):
+        await async_charges_client.submit_batch("card", [])
+
+
+@pytest.mark.asyncio
+async def test_check_pending_charge_coalesces_requests(async_charges_client, mocked_responses):
+    reference = "test-reference1234"
+    url = f"https://api.paystack.co/charge/{reference}"
+    mocked_responses.get(url, status=200, payload={"status": True, "data": {"status": "pending"}})
+    first, second = await asyncio.gather(
+        async_charges_client.check_pending_charge(reference),
+        async_charges_client.check_pending_charge(reference),
+    )
+    assert first is second
+    assert len(mocked_responses.requests[("GET", URL(url))]) == 1
+    assert not async_charges_client._pending_requests
+
+
+@pytest.mark.asyncio
+async def test_check_pending_charge_error_is_not_cached(async_charges_client, mocked_responses):
+    reference = "test-reference1234"
+    url = f"https://api.paystack.co/charge/{reference}"
+    mocked_responses.get(url, status=503, payload={"status": False})
+    mocked_responses.get(url, status=200, payload={"status": True})
+    with pytest.raises(PayStackServerError):
+        await async_charges_client.check_pending_charge(reference)
+    response = await async_charges_client.check_pending_charge(reference)
+    assert response.status is True
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_bad_payload_does_not_stop_others(async_charges_client, mocked_responses):
+    url = "https://api.paystack.co/charge/submit_otp"
+    mocked_responses.post(url, status=200, payload={"status": True})
+    good, bad = await async_charges_client.submit_batch(
+        "otp", [{"otp": 123456, "reference": "test-reference1"}, {"otp": 654321}]
+    )
+    assert good.status is True
+    assert isinstance(bad, TypeError)
+
+
+@pytest.mark.asyncio
+async def test_check_pending_charge_polls_are_fresh(async_charges_client, mocked_responses):
+    reference = "test-reference1234"
+    url = f"https://api.paystack.co/charge/{reference}"
+    mocked_responses.get(url, status=200, payload={"status": True, "data": {"status": "pending"}})
+    mocked_responses.get(url, status=200, payload={"status": True, "data": {"status": "success"}})
+    first = await async_charges_client.check_pending_charge(reference)
+    second = await async_charges_client.check_pending_charge(reference)
+    assert first.data["status"] == "pending"
+    assert second.data["status"] == "success"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", [0, -1, None])
+async def test_batches_reject_invalid_concurrency(async_charges_client, concurrency):
+    """Test that pending checks and submit batches with no request slots are rejected"""
+    with pytest.raises(TypeValueError):
+        await async_charges_client.check_pending_charges(["test-reference1"], concurrency=concurrency)
+    with pytest.raises(TypeValueError):
+        await async_charges_client.submit_batch(
+            "otp", [{"otp": 123456, "reference": "test-reference1"}], concurrency=concurrency
+        )
@@ -1,8 +1,12 @@
 """ Test for synchronous Customers """
 
+import asyncio
+import json
 from datetime import date
 import pytest
+from yarl import URL
 
+from paystackease import RawJSON
 from tests.conftest import async_customers_client, mocked_responses
 
 
@@ -47,6 +51,24 @@ async def test_create_customer(
     assert response is not None
 
 
+@pytest.mark.asyncio
+async def test_create_customer_with_raw_metadata(async_customers_client, mocked_responses):
+    """Test that encoded metadata is sent as-is"""
+    url = "https://api.paystack.co/customer"
+    mocked_responses.post(url, status=200, payload={"status": True})
+    await async_customers_client.create_customer(
+        "test@email.com", "test", "test", "08012345678", metadata=RawJSON(b'{"key1":"value1"}')
+    )
+    (request,) = mocked_responses.requests[("POST", URL(url))]
+    assert json.loads(request.kwargs["data"]) == {
+        "email": "test@email.com",
+        "first_name": "test",
+        "last_name": "test",
+        "phone": "08012345678",
+        "metadata": {"key1": "value1"},
+    }
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     (
@@ -214,6 +236,19 @@ async def test_fetch_customer(async_customers_client, mocked_responses):
     assert response is not None
 
 
+@pytest.mark.asyncio
+async def test_fetch_customer_is_cached(async_customers_client, mocked_responses):
+    """Test that a fetched customer is reused within the cache window"""
+    url = "https://api.paystack.co/customer/customer_code"
+    mocked_responses.get(url, status=200, payload={"status": True}, repeat=True)
+    first = await async_customers_client.fetch_customer(email_or_code="customer_code")
+    second = await async_customers_client.fetch_customer(email_or_code="customer_code")
+    assert first is second
+    async_customers_client.clear_cache()
+    await async_customers_client.fetch_customer(email_or_code="customer_code")
+    assert len(mocked_responses.requests[("GET", URL(url))]) == 2
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("per_page", "page", "from_date", "to_date"),
@@ -267,3 +302,31 @@ async def test_list_customers(
     )
     mocked_responses.assert_called()
     assert response is not None
+
+
+@pytest.mark.asyncio
+async def test_fetch_customer_after_update_is_fresh(async_customers_client, mocked_responses):
+    """Test that updating a customer drops the cached fetch"""
+    url = "https://api.paystack.co/customer/CUS_1"
+    mocked_responses.get(url, status=200, payload={"status": True, "data": {"first_name": "old"}})
+    mocked_responses.put(url, status=200, payload={"status": True, "data": {"first_name": "new"}})
+    mocked_responses.get(url, status=200, payload={"status": True, "data": {"first_name": "new"}})
+    await async_customers_client.fetch_customer("CUS_1")
+    await async_customers_client.update_customer("CUS_1", first_name="new")
+    response = await async_customers_client.fetch_customer("CUS_1")
+    assert response.data == {"first_name": "new"}
+
+
+@pytest.mark.asyncio
+async def test_fetch_in_flight_during_update_is_not_cached(async_customers_client, mocked_responses):
+    """Test that a fetch started before an update does not cache the old customer"""
+    url = "https://api.paystack.co/customer/CUS_1"
+    mocked_responses.get(url, status=200, payload={"status": True, "data": {"first_name": "old"}})
+    mocked_responses.put(url, status=200, payload={"status": True})
+    mocked_responses.get(url, status=200, payload={"status": True, "data": {"first_name": "new"}})
+    await asyncio.gather(
+        async_customers_client.fetch_customer("CUS_1"),
+        async_customers_client.update_customer("CUS_1", first_name="new"),
+    )
+    response = await async_customers_client.fetch_customer("CUS_1")
+    assert response.data == {"first_name": "new"}
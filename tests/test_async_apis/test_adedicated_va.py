@@ -3,6 +3,7 @@
 from datetime import date
 import pytest
 
+from paystackease.core import TypeValueError
 from tests.conftest import async_dva_client, mocked_responses
 
 
@@ -362,3 +363,54 @@ async def test_fetch_bank_providers(async_dva_client, mocked_responses):
     response = await async_dva_client.fetch_bank_providers()
     mocked_responses.assert_called()
     assert response is not None
+
+
+@pytest.mark.asyncio
+async def test_bulk_assign_dvs(async_dva_client, mocked_responses):
+    """Test for bulk assigning dedicated virtual accounts"""
+    url = "https://api.paystack.co/dedicated_account"
+    mocked_responses.post(url, status=200, payload={"status": True})
+    mocked_responses.post(url, status=200, payload={"status": False})
+    payloads = [
+        {
+            "email": f"test{index}@email.com",
+            "first_name": "test",
+            "last_name": "test",
+            "phone": "08012345678",
+            "preferred_bank": "wema-bank",
+            "country": "NG",
+        }
+        for index in range(2)
+    ]
+    responses = await async_dva_client.bulk_assign_dedicated_virtual_account(payloads, concurrency=1)
+    assert len(responses) == 2
+    assert {response.status for response in responses} == {True, False}
+
+
+@pytest.mark.asyncio
+async def test_bulk_assign_dvs_bad_payload(async_dva_client, mocked_responses):
+    """Test that a payload with a wrong argument is returned as its error"""
+    url = "https://api.paystack.co/dedicated_account"
+    mocked_responses.post(url, status=200, payload={"status": True})
+    payloads = [
+        {
+            "email": "test@email.com",
+            "first_name": "test",
+            "last_name": "test",
+            "phone": "08012345678",
+            "preferred_bank": "wema-bank",
+            "country": "NG",
+        },
+        {"email": "test@email.com", "unknown": "test"},
+    ]
+    good, bad = await async_dva_client.bulk_assign_dedicated_virtual_account(payloads)
+    assert good.status is True
+    assert isinstance(bad, TypeError)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", [0, -1])
+async def test_bulk_assign_dvs_invalid_concurrency(async_dva_client, concurrency):
+    """Test that a batch with no request slots is rejected instead of waiting forever"""
+    with pytest.raises(TypeValueError):
+        await async_dva_client.bulk_assign_dedicated_virtual_account([{"email": "test@email.com"}], concurrency)
@@ -224,3 +224,14 @@ async def test_update_subaccount(
     )
     mocked_responses.assert_called()
     assert response is not None
+
+
+@pytest.mark.asyncio
+async def test_iter_subaccounts(async_subaccounts_client, mocked_responses):
+    """Test that the subaccounts are fetched until an empty page, even after a short one"""
+    url = "https://api.paystack.co/subaccount?page={page}&perPage=2"
+    mocked_responses.get(url.format(page=1), status=200, payload={"status": True, "data": [{"id": 1}]})
+    mocked_responses.get(url.format(page=2), status=200, payload={"status": True, "data": [{"id": 2}, {"id": 3}]})
+    mocked_responses.get(url.format(page=3), status=200, payload={"status": True, "data": []})
+    subaccounts = [subaccount async for subaccount in async_subaccounts_client.iter_subaccounts(per_page=2)]
+    assert [subaccount["id"] for subaccount in subaccounts] == [1, 2, 3]
@@ -6,6 +6,7 @@ from datetime import date
 import pytest
 import responses
 
+from paystackease.core import TypeValueError
 from tests.conftest import async_subscriptions_client, mocked_responses
 
 
@@ -203,3 +204,24 @@ async def test_send_update_subscription(async_subscriptions_client, mocked_respo
     mocked_responses.assert_called()
     assert response.status == "success"
     assert response is not None
+
+
+@pytest.mark.asyncio
+async def test_iter_subscriptions(async_subscriptions_client, mocked_responses):
+    """Test that the subscriptions are fetched one page at a time"""
+    url = "https://api.paystack.co/subscription?page={page}&perPage=2"
+    mocked_responses.get(url.format(page=1), status=200, payload={"status": True, "data": [{"id": 1}, {"id": 2}]})
+    mocked_responses.get(url.format(page=2), status=200, payload={"status": True, "data": [{"id": 3}]})
+    mocked_responses.get(url.format(page=3), status=200, payload={"status": True, "data": []})
+    subscriptions = [
+        subscription async for subscription in async_subscriptions_client.iter_subscriptions(per_page=2)
+    ]
+    assert [subscription["id"] for subscription in subscriptions] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("per_page", [0, -1, None])
+async def test_iter_subscriptions_invalid_per_page(async_subscriptions_client, per_page):
+    """Test that a page size that could never end the iteration is rejected"""
+    with pytest.raises(TypeValueError):
+        async_subscriptions_client.iter_subscriptions(per_page=per_page)
@@ -4,6 +4,7 @@ import json
 from datetime import date
 import pytest
 import responses
+from yarl import URL
 
 from tests.conftest import async_transfers_control_client, mocked_responses
 
@@ -110,3 +111,32 @@ async def test_enable_otp(async_transfers_control_client, mocked_responses):
     mocked_responses.assert_called()
     assert response.status == "success"
     assert response is not None
+
+
+@pytest.mark.asyncio
+async def test_enable_otp_is_not_repeated(async_transfers_control_client, mocked_responses):
+    """Test that enabling OTP twice only makes one request"""
+    url = "https://api.paystack.co/transfer/enable_otp"
+    mocked_responses.post(url, status=200, payload={"status": True}, repeat=True)
+    first = await async_transfers_control_client.enable_otp()
+    second = await async_transfers_control_client.enable_otp()
+    assert second is first
+    assert len(mocked_responses.requests[("POST", URL(url))]) == 1
+    async_transfers_control_client.clear_cache()
+    await async_transfers_control_client.enable_otp()
+    assert len(mocked_responses.requests[("POST", URL(url))]) == 2
+
+
+@pytest.mark.asyncio
+async def test_disable_otp_after_finalize_is_sent(async_transfers_control_client, mocked_responses):
+    """Test that disabling OTP is always sent, and that enabling it again is not skipped"""
+    base_url = "https://api.paystack.co/transfer"
+    mocked_responses.post(f"{base_url}/disable_otp_finalize", status=200, payload={"status": True})
+    mocked_responses.post(f"{base_url}/disable_otp", status=200, payload={"status": True})
+    mocked_responses.post(f"{base_url}/enable_otp", status=200, payload={"status": True})
+    finalized = await async_transfers_control_client.finalize_disable_otp(otp="123")
+    disabled = await async_transfers_control_client.disable_otp()
+    assert disabled is not finalized
+    await async_transfers_control_client.enable_otp()
+    for endpoint in ("disable_otp_finalize", "disable_otp", "enable_otp"):
+        assert len(mocked_responses.requests[("POST", URL(f"{base_url}/{endpoint}"))]) == 1
@@ -1,5 +1,6 @@
 """ Test for synchronous Customers """
 
+import asyncio
 import json
 from datetime import date
 import pytest
@@ -56,6 +57,30 @@ async def test_resolve_card(async_verification_client, mocked_responses):
     assert response is not None
 
 
+@pytest.mark.asyncio
+async def test_resolve_card_is_cached(async_verification_client, mocked_responses):
+    """Test that a resolved card BIN is reused instead of requested again"""
+    bin_code = "test-bin-code"
+    url = f"https://api.paystack.co/decision/bin/{bin_code}"
+    mocked_responses.get(url, status=200, payload={"status": True})
+    first = await async_verification_client.resolve_card_bin(bin_code=bin_code)
+    second = await async_verification_client.resolve_card_bin(bin_code=bin_code)
+    assert second is first
+
+
+@pytest.mark.asyncio
+async def test_resolve_account_positional_and_keyword_share_cache(async_verification_client, mocked_responses):
+    """Test that concurrent lookups passed positionally or by keyword share one request"""
+    url = "https://api.paystack.co/bank/resolve?account_number=0000000000&bank_code=053"
+    mocked_responses.get(url, status=200, payload={"status": True})
+    first, second = await asyncio.gather(
+        async_verification_client.resolve_account("0000000000", "053"),
+        async_verification_client.resolve_account(bank_code="053", account_number="0000000000"),
+    )
+    assert second is first
+    assert len(mocked_responses.requests) == 1
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     (
@@ -1,9 +1,17 @@
 """ Tests for the async base client API"""
 
+import asyncio
+import threading
+
 import pytest
+from aiohttp import ClientSession
 from aioresponses import aioresponses
 from datetime import datetime, date
+from yarl import URL
 
+from paystackease import AsyncPayStackBase
+from paystackease.core import AsyncBaseClientAPI, close_shared_connector, configure
+from paystackease.core._api_connector import get_shared_connector
 from tests.conftest import async_base_client, env_var
 
 
@@ -45,3 +53,134 @@ async def test_request_url(async_base_client):
         response = await async_base_client._request_url("GET", "/test")
         assert response.status == "success"
         mock_client.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused():
+    """Tests that one session is kept for every request of a client"""
+    client = AsyncBaseClientAPI()
+    with aioresponses() as mock_client:
+        mock_client.get("https://api.paystack.co/test", payload={"status": "success"}, repeat=True)
+        await client._request_url("GET", "/test")
+        session = client._session
+        await client._request_url("GET", "/test")
+        assert client._session is session
+    await client.aclose()
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_clients_share_connector():
+    """Tests that every async client draws from the same connection pool"""
+    configure(keepalive=90, max_connections=10)
+    async with AsyncBaseClientAPI() as first, AsyncBaseClientAPI() as second:
+        first_session = await first._get_session()
+        second_session = await second._get_session()
+        connector = first_session.connector
+        assert second_session.connector is connector
+        assert connector.limit == 10
+    assert not connector.closed
+    await close_shared_connector()
+    configure()
+
+
+@pytest.mark.asyncio
+async def test_paystack_base_shares_session():
+    """Tests that every client of AsyncPayStackBase uses one session"""
+    async with AsyncPayStackBase() as paystack_async:
+        session = paystack_async._session
+        assert all(client._session is session for client in paystack_async._clients)
+        assert session.headers["Authorization"].startswith("Bearer ")
+    assert session.closed
+    assert all(client._session is None for client in paystack_async._clients)
+
+
+@pytest.mark.asyncio
+async def test_paystack_base_keeps_caller_session_open():
+    """Tests that a session passed in is used with the Paystack headers and left open"""
+    async with ClientSession() as session:
+        async with AsyncPayStackBase(session=session) as paystack_async:
+            with aioresponses() as mock_client:
+                mock_client.get("https://api.paystack.co/test", payload={"status": True})
+                await paystack_async.plans._request_url("GET", "/test")
+                (request,) = mock_client.requests[("GET", URL("https://api.paystack.co/test"))]
+                assert request.kwargs["headers"]["Authorization"].startswith("Bearer ")
+        assert not session.closed
+        assert paystack_async.plans._session is session
+
+
+@pytest.mark.asyncio
+async def test_configure_closes_previous_connector():
+    """Tests that configure() closes the pool it replaces and clients move to the new one"""
+    client = AsyncBaseClientAPI()
+    with aioresponses() as mock_client:
+        mock_client.get("https://api.paystack.co/test", payload={"status": True}, repeat=True)
+        await client._request_url("GET", "/test")
+        connector = client._session.connector
+        configure(max_connections=20)
+        assert connector.closed
+        await client._request_url("GET", "/test")
+        assert client._session.connector.limit == 20
+    await client.aclose()
+    await close_shared_connector()
+    configure()
+
+
+def test_connector_of_finished_loop_is_closed():
+    """Tests that the pool of an event loop that has finished is closed when a new loop asks for one"""
+
+    async def get_connector():
+        return get_shared_connector()
+
+    first = asyncio.run(get_connector())
+    second = asyncio.run(get_connector())
+    assert first.closed
+    assert second is not first
+    asyncio.run(close_shared_connector())
+
+
+@pytest.mark.asyncio
+async def test_use_and_release_session():
+    """Tests that a borrowed session is left open by the client and forgotten on release"""
+    client = AsyncBaseClientAPI()
+    own_session = await client._get_session()
+    async with ClientSession() as shared:
+        await client._use_session(shared)
+        assert own_session.closed
+        await client.aclose()
+        assert not shared.closed
+        client._release_session(object())
+        assert client._session is shared
+        client._release_session(shared)
+        assert client._session is None
+        assert client._owns_session
+
+
+def test_each_event_loop_keeps_its_own_connector():
+    """Tests that event loops running in two threads do not close each other's pool"""
+    barrier = threading.Barrier(2, timeout=5)
+    connectors = {}
+
+    async def use_connector(name):
+        connector = get_shared_connector()
+        barrier.wait()
+        # The other thread has now asked for its connector as well
+        assert get_shared_connector() is connector
+        assert not connector.closed
+        connectors[name] = connector
+        barrier.wait()
+
+    threads = [threading.Thread(target=asyncio.run, args=(use_connector(name),)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert connectors["a"] is not connectors["b"]
+
+    async def get_connector():
+        return get_shared_connector()
+
+    # Asking from a new loop closes the pools of the loops that have finished
+    asyncio.run(get_connector())
+    assert connectors["a"].closed and connectors["b"].closed
+    asyncio.run(close_shared_connector())
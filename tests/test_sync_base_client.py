@@ -1,8 +1,14 @@
 """ Tests for the sync base client API"""
 
+import json
+
+import pytest
 import responses
 from datetime import date, datetime
+from uuid import UUID
 
+from paystackease.core import PayStackError, RawJSON, SyncBaseClientAPI, TypeValueError, _api_json
+from paystackease.helpers import Currency
 from tests.conftest import sync_base_client, env_var
 
 
@@ -42,3 +48,84 @@ def test_request_url(sync_base_client):
     assert len(responses.calls) == 1
     assert responses.calls[0].request.url == "https://api.paystack.co/test"
     assert response.status == "success"
+
+
+def test_session_keeps_connection_pool():
+    """Tests that a client-owned session is mounted with a retrying connection pool"""
+    with SyncBaseClientAPI() as client:
+        adapter = client._session.get_adapter("https://api.paystack.co/")
+        assert adapter.max_retries.total == 3
+        assert 500 in adapter.max_retries.status_forcelist
+        assert "POST" not in adapter.max_retries.allowed_methods
+
+
+def test_compact(sync_base_client):
+    """Tests that None values are dropped from request payloads"""
+    assert sync_base_client._compact({"key": "value", "empty": None}) == {"key": "value"}
+    assert sync_base_client._compact([{"key": None}]) == [{"key": None}]
+    assert sync_base_client._compact(None) is None
+
+
+@responses.activate
+def test_request_url_invalid_json(sync_base_client):
+    """Tests that a non JSON response raises a PayStackError"""
+    responses.add(responses.GET, "https://api.paystack.co/test", body="<html></html>", status=502)
+    with pytest.raises(PayStackError):
+        sync_base_client._request_url("GET", "test")
+
+
+def test_specialized_converters(sync_base_client):
+    """Tests for the bool and date converters"""
+    assert sync_base_client._bool_to_string(True) == "true"
+    assert sync_base_client._bool_to_string(False) == "false"
+    assert sync_base_client._bool_to_string(None) is None
+    assert sync_base_client._date_to_string(date(2024, 1, 31)) == "2024-01-31"
+    assert sync_base_client._date_to_string(datetime(2024, 1, 31, 8, 5, 1)) == "2024-01-31 08:05:01"
+    assert sync_base_client._date_to_string(None) is None
+    with pytest.raises(TypeValueError):
+        sync_base_client._date_to_string("2024-01-31")
+
+
+@pytest.mark.parametrize("value", [1, [1], {"key": "value"}])
+def test_converters_reject_unsupported_values(sync_base_client, value):
+    """Tests that the converters raise TypeValueError, as documented, for unsupported values"""
+    with pytest.raises(TypeValueError):
+        sync_base_client._convert_to_string(value)
+    with pytest.raises(TypeValueError):
+        sync_base_client._bool_to_string(value)
+    with pytest.raises(TypeValueError):
+        sync_base_client._date_to_string(value)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_places_raw_json_as_is(monkeypatch, use_orjson):
+    """Tests that RawJSON values are placed in the body without being encoded again"""
+    if not use_orjson:
+        monkeypatch.setattr(_api_json, "orjson", None)
+    metadata = RawJSON(b'{"custom_fields":[]}')
+    body = _api_json.dumps({"email": "test@email.com", "metadata": metadata})
+    assert json.loads(body) == {"email": "test@email.com", "metadata": {"custom_fields": []}}
+    assert metadata.data in _api_json._as_bytes(body)
+    assert json.loads(_api_json.dumps({"metadata": metadata})) == {"metadata": {"custom_fields": []}}
+    assert json.loads(_api_json.dumps({"items": [metadata]})) == {"items": [{"custom_fields": []}]}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_encodes_the_same_without_orjson(monkeypatch, use_orjson):
+    """Tests that enums, dates and UUIDs are encoded the same with either JSON backend"""
+    if not use_orjson:
+        monkeypatch.setattr(_api_json, "orjson", None)
+    body = {
+        "currency": Currency.NGN,
+        "date": date(2024, 1, 2),
+        "datetime": datetime(2024, 1, 2, 3, 4, 5),
+        "id": UUID("12345678-1234-5678-1234-567812345678"),
+    }
+    assert json.loads(_api_json.dumps(body)) == {
+        "currency": "NGN",
+        "date": "2024-01-02",
+        "datetime": "2024-01-02T03:04:05",
+        "id": "12345678-1234-5678-1234-567812345678",
+    }
+    with pytest.raises(TypeError):
+        _api_json.dumps({"value": object()})